@@ -9,6 +9,7 @@ from alembic import context
 
 from app.db.database import Base, DATABASE_URL
 from app.models.user import User
+from app.models.validation import ValidationRun, ValidationFinding
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,78 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
+from starlette.concurrency import run_in_threadpool
+from app.models.user import User
+from app.services.user import UserService
+from app.services.document import DocumentService
+from app.schemas.document import (
+    DocumentUploadResponse,
+    BatchSubmitResponse,
+    BulkTaskStatusRequest,
+    BulkTaskStatusResponse,
+)
+
+document_router = APIRouter()
+
+
+@document_router.post(
+    "/upload",
+    summary="Upload A PDF And Queue Its Validation",
+    response_model=DocumentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload(
+    request: Request,
+    filename: str = "document.pdf",
+    previous_hash: Optional[str] = None,
+    user: User = Depends(UserService.authenticate_current_user),
+) -> DocumentUploadResponse:
+    response = await DocumentService.upload_document(
+        request=request, filename=filename, user_id=user.id, previous_hash=previous_hash
+    )
+    return response
+
+
+@document_router.post(
+    "/batch",
+    summary="Upload Or Reference Many PDFs And Queue Their Validation",
+    response_model=BatchSubmitResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def batch(
+    files: List[UploadFile] = File(default=[]),
+    document_hashes: List[str] = Form(default=[]),
+    user: User = Depends(UserService.authenticate_current_user),
+) -> BatchSubmitResponse:
+    response = await DocumentService.submit_batch(
+        files=files, document_hashes=document_hashes, user_id=user.id
+    )
+    return response
+
+
+@document_router.get(
+    "/batch_status",
+    summary="Get The Status Of Every Task In A Batch",
+    response_model=BulkTaskStatusResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def batch_status(
+    batch_id: str,
+    _: User = Depends(UserService.authenticate_current_user),
+) -> BulkTaskStatusResponse:
+    task_ids = await run_in_threadpool(DocumentService.get_batch_task_ids, batch_id)
+    response = await run_in_threadpool(DocumentService.get_tasks_status, task_ids)
+    return response
+
+
+@document_router.post(
+    "/tasks_status",
+    summary="Get The Status Of Many Tasks",
+    response_model=BulkTaskStatusResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def tasks_status(
+    data: BulkTaskStatusRequest,
+    _: User = Depends(UserService.authenticate_current_user),
+) -> BulkTaskStatusResponse:
+    response = await run_in_threadpool(DocumentService.get_tasks_status, data.task_ids)
+    return response
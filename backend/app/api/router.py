@@ -1,7 +1,11 @@
 from fastapi import APIRouter
 from app.api.user import user_router
+from app.api.document import document_router
+from app.api.validation import validation_router
 
 
 router = APIRouter()
 
 router.include_router(user_router, prefix="/user", tags=["user"])
+router.include_router(document_router, prefix="/document", tags=["document"])
+router.include_router(validation_router, prefix="/validation", tags=["validation"])
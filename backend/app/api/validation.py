@@ -0,0 +1,86 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_db
+from app.models.user import User
+from app.services.user import UserService
+from app.services.validation import ValidationService
+from app.schemas.validation import (
+    ValidationRunResponse,
+    ValidationRunDetailResponse,
+    RuleFindingResponse,
+)
+
+validation_router = APIRouter()
+
+
+@validation_router.get(
+    "/runs",
+    summary="Get Validation Runs Of The Current User",
+    response_model=List[ValidationRunResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def runs(
+    limit: int = 50,
+    offset: int = 0,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(UserService.authenticate_current_user),
+) -> List[ValidationRunResponse]:
+    response = await ValidationService.get_runs_by_user(
+        user_id=user.id, db=db, limit=limit, offset=offset
+    )
+    return response
+
+
+@validation_router.get(
+    "/runs_by_document",
+    summary="Get Validation Runs By Document Hash",
+    response_model=List[ValidationRunResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def runs_by_document(
+    document_hash: str,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(UserService.authenticate_current_user),
+) -> List[ValidationRunResponse]:
+    response = await ValidationService.get_runs_by_document(
+        document_hash=document_hash, user_id=user.id, db=db
+    )
+    return response
+
+
+@validation_router.get(
+    "/run_by_task_id",
+    summary="Get A Validation Run With Its Findings",
+    response_model=ValidationRunDetailResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def run_by_task_id(
+    task_id: str,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(UserService.authenticate_current_user),
+) -> ValidationRunDetailResponse:
+    response = await ValidationService.get_run_by_task_id(
+        task_id=task_id, user_id=user.id, db=db
+    )
+    return response
+
+
+@validation_router.get(
+    "/findings_by_rule",
+    summary="Get Validation Findings By Rule",
+    response_model=List[RuleFindingResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def findings_by_rule(
+    rule: str,
+    code: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(UserService.authenticate_current_user),
+) -> List[RuleFindingResponse]:
+    response = await ValidationService.get_findings_by_rule(
+        rule=rule, user_id=user.id, db=db, code=code, limit=limit, offset=offset
+    )
+    return response
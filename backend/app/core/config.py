@@ -1,12 +1,14 @@
 import os
 import logging
 import asyncio
+from pathlib import Path
 from typing import List, ClassVar
 from dotenv import load_dotenv
 from pydantic import AnyHttpUrl, computed_field, PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from redis import Redis
 from celery import Celery
+from kombu import Queue
 from celery.utils.log import get_task_logger
 
 
@@ -33,9 +35,26 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = os.environ["POSTGRES_PORT"]
     MAX_CONNECTIONS_COUNT: int = os.environ["MAX_CONNECTIONS_COUNT"]
     MIN_CONNECTIONS_COUNT: int = os.environ["MIN_CONNECTIONS_COUNT"]
+    # "api" sizes the pool from MIN/MAX_CONNECTIONS_COUNT; worker-start.sh
+    # selects "worker", whose children each keep a small pool of their own.
+    DB_POOL_PROFILE: str = os.getenv("DB_POOL_PROFILE", "api")
+    WORKER_DB_POOL_SIZE: int = os.getenv("WORKER_DB_POOL_SIZE", 1)
+    WORKER_DB_MAX_OVERFLOW: int = os.getenv("WORKER_DB_MAX_OVERFLOW", 1)
+    DB_POOL_TIMEOUT_SECONDS: float = os.getenv("DB_POOL_TIMEOUT_SECONDS", 30)
+    DB_POOL_RECYCLE_SECONDS: int = os.getenv("DB_POOL_RECYCLE_SECONDS", 1800)
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = os.getenv(
+        "DB_PREPARED_STATEMENT_CACHE_SIZE", 100
+    )
 
     JWT_SECRET_KEY: str = os.environ["JWT_SECRET_KEY"]
+    # bcrypt cost, and the threads (and waiting operations) allowed for it.
+    BCRYPT_ROUNDS: int = os.getenv("BCRYPT_ROUNDS", 12)
+    PASSWORD_HASH_WORKERS: int = os.getenv("PASSWORD_HASH_WORKERS", 4)
+    PASSWORD_HASH_MAX_QUEUE: int = os.getenv("PASSWORD_HASH_MAX_QUEUE", 64)
     TOKEN_ALGORITHM: str = os.environ["TOKEN_ALGORITHM"]
+    # Verified access tokens kept so repeat requests skip signature checks; 0 disables.
+    TOKEN_CACHE_MAX_SIZE: int = os.getenv("TOKEN_CACHE_MAX_SIZE", 10000)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"]
     REFRESH_TOKEN_EXPIRE_MINUTES: int = os.environ["REFRESH_TOKEN_EXPIRE_MINUTES"]
     RESET_TOKEN_EXPIRE_MINUTES: int = os.environ["RESET_TOKEN_EXPIRE_MINUTES"]
@@ -46,9 +65,64 @@ class Settings(BaseSettings):
     EMAIL_PASSWORD: str = os.environ["EMAIL_PASSWORD"]
 
     REDIS_URL: str = os.environ["REDIS_URL"]
+    # Users looked up by authenticate_current_user are cached in-process
+    # and, unless disabled, in Redis for every API replica.
+    USER_CACHE_LOCAL_TTL_SECONDS: float = os.getenv("USER_CACHE_LOCAL_TTL_SECONDS", 30)
+    USER_CACHE_MAX_SIZE: int = os.getenv("USER_CACHE_MAX_SIZE", 10000)
+    USER_CACHE_REDIS_ENABLED: bool = (
+        os.getenv("USER_CACHE_REDIS_ENABLED", "true").lower() == "true"
+    )
+    USER_CACHE_REDIS_TTL_SECONDS: int = os.getenv("USER_CACHE_REDIS_TTL_SECONDS", 300)
     CELERY_BROKER_URL: str = os.environ["CELERY_BROKER_URL"]
     CELERY_RESULT_BACKEND: str = os.environ["CELERY_RESULT_BACKEND"]
-    
+    CELERY_WORKER_CONCURRENCY: int = os.getenv(
+        "CELERY_WORKER_CONCURRENCY", os.cpu_count() or 1
+    )
+    CELERY_PREFETCH_MULTIPLIER: int = os.getenv("CELERY_PREFETCH_MULTIPLIER", 1)
+    # PyMuPDF keeps native memory, so children are replaced after this many
+    # tasks or once their resident memory passes this many megabytes.
+    CELERY_MAX_TASKS_PER_CHILD: int = os.getenv("CELERY_MAX_TASKS_PER_CHILD", 100)
+    CELERY_MAX_MEMORY_PER_CHILD_MB: int = os.getenv("CELERY_MAX_MEMORY_PER_CHILD_MB", 1024)
+
+    # Validation time budgets: the soft limit is the base plus a per-page
+    # allowance, and the hard limit kills the child a grace period later.
+    TASK_SOFT_TIME_LIMIT_BASE: float = os.getenv("TASK_SOFT_TIME_LIMIT_BASE", 30)
+    TASK_SOFT_TIME_LIMIT_PER_PAGE: float = os.getenv("TASK_SOFT_TIME_LIMIT_PER_PAGE", 0.5)
+    TASK_HARD_TIME_LIMIT_GRACE: float = os.getenv("TASK_HARD_TIME_LIMIT_GRACE", 30)
+
+    MAX_UPLOAD_PAGES: int = os.getenv("MAX_UPLOAD_PAGES", 1500)
+    MAX_UPLOAD_BYTES: int = os.getenv("MAX_UPLOAD_BYTES", 100 * 1024 * 1024)
+
+    # Documents within both limits are validated on the small queue.
+    SMALL_DOCUMENT_MAX_PAGES: int = os.getenv("SMALL_DOCUMENT_MAX_PAGES", 25)
+    SMALL_DOCUMENT_MAX_BYTES: int = os.getenv("SMALL_DOCUMENT_MAX_BYTES", 1024 * 1024)
+    VALIDATION_SMALL_QUEUE: str = os.getenv("VALIDATION_SMALL_QUEUE", "validation_small")
+    VALIDATION_LARGE_QUEUE: str = os.getenv("VALIDATION_LARGE_QUEUE", "validation_large")
+    # Most documents in one batch submission or bulk status lookup.
+    BATCH_MAX_DOCUMENTS: int = os.getenv("BATCH_MAX_DOCUMENTS", 500)
+
+    UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "/tmp/grant_engine/uploads")
+    VALIDATORS_DIR: str = os.getenv(
+        "VALIDATORS_DIR", str(Path(__file__).resolve().parents[2] / "scripts" / "v2")
+    )
+    EXTRACTION_STORE_PATH: str = os.getenv(
+        "EXTRACTION_STORE_PATH", "/tmp/grant_engine/extraction.sqlite3"
+    )
+    # Least-recently-used documents are evicted past this many payload bytes.
+    EXTRACTION_STORE_MAX_BYTES: int = os.getenv(
+        "EXTRACTION_STORE_MAX_BYTES", 512 * 1024 * 1024
+    )
+    # Process pool used to extract long documents. Celery's prefork children
+    # cannot start one and the worker already runs a child per core, so
+    # workers extract serially unless this is raised under -P solo/threads.
+    PDF_PARALLEL_MAX_WORKERS: int = os.getenv("PDF_PARALLEL_MAX_WORKERS", 1)
+    PDF_PARALLEL_PAGE_THRESHOLD: int = os.getenv("PDF_PARALLEL_PAGE_THRESHOLD", 64)
+    # Most progress messages published per second for one validation task.
+    TASK_PROGRESS_MAX_RATE: float = os.getenv("TASK_PROGRESS_MAX_RATE", 2)
+    # Validation runs are kept in Postgres; the Celery result blob only
+    # needs to outlive the client polling for it.
+    VALIDATION_RESULT_TTL_DAYS: int = os.getenv("VALIDATION_RESULT_TTL_DAYS", 30)
+    CELERY_RESULT_EXPIRES: int = os.getenv("CELERY_RESULT_EXPIRES", 24 * 60 * 60)
 
     logger: ClassVar[logging.Logger] = get_task_logger(__name__)
 
@@ -62,6 +136,27 @@ class Settings(BaseSettings):
     celery.conf.broker_connection_retry_on_startup = True
     celery.conf.task_track_started = True
     celery.conf.task_ignore_result = False
+    celery.conf.result_expires = int(CELERY_RESULT_EXPIRES)
+    celery.conf.worker_concurrency = int(CELERY_WORKER_CONCURRENCY)
+    # Long PDF tasks must not hoard short ones: reserve one task per child and
+    # acknowledge only once it has run.
+    celery.conf.worker_prefetch_multiplier = int(CELERY_PREFETCH_MULTIPLIER)
+    celery.conf.task_acks_late = True
+    # A PDF that crashes its child is failed, not redelivered to the next one.
+    celery.conf.task_reject_on_worker_lost = False
+    celery.conf.worker_max_tasks_per_child = int(CELERY_MAX_TASKS_PER_CHILD)
+    celery.conf.worker_max_memory_per_child = int(CELERY_MAX_MEMORY_PER_CHILD_MB) * 1024
+    celery.conf.task_queues = (
+        Queue("celery"),
+        Queue(VALIDATION_SMALL_QUEUE),
+        Queue(VALIDATION_LARGE_QUEUE),
+    )
+    # Workers consuming several queues take small, high-priority jobs first.
+    celery.conf.broker_transport_options = {
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    }
 
     @computed_field
     @property
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from passlib.context import CryptContext
+from app.core.config import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when more password operations are queued than the hasher accepts."""
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification off the event loop.
+
+    At most max_workers operations run at once (bcrypt releases the GIL, so
+    threads suffice); up to max_queue more wait for a worker and anything
+    beyond that is rejected instead of piling up behind a login storm.
+    """
+
+    def __init__(self, context: CryptContext, max_workers: int, max_queue: int):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._pending - self.max_workers)
+
+    async def _run(self, func, *args):
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy("Too many password operations in progress")
+        self._pending += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, func, *args
+            )
+        finally:
+            self._pending -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Return whether password matches, and a new hash if the stored one is outdated."""
+        return await self._run(self.context.verify_and_update, password, hashed_password)
+
+    def metrics(self) -> Dict:
+        return {
+            "max_workers": self.max_workers,
+            "running": min(self._pending, self.max_workers),
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+# Hashes made with any other cost are rehashed on the next successful login.
+password_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=int(settings.BCRYPT_ROUNDS),
+    bcrypt__min_rounds=int(settings.BCRYPT_ROUNDS),
+    bcrypt__max_rounds=int(settings.BCRYPT_ROUNDS),
+)
+
+password_hasher = PasswordHasher(
+    password_context,
+    max_workers=int(settings.PASSWORD_HASH_WORKERS),
+    max_queue=int(settings.PASSWORD_HASH_MAX_QUEUE),
+)
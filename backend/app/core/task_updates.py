@@ -0,0 +1,102 @@
+import json
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+
+CHANNEL_PREFIX = "task_updates:"
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+class TaskUpdatesHub:
+    """Fans task_updates:* messages out to the task watchers of this process.
+
+    One Redis connection holds a single pattern subscription, started on the
+    first subscribe. Each watcher gets its own bounded asyncio queue. If a
+    watcher falls behind, its oldest messages are dropped so one slow client
+    cannot hold up the others.
+    """
+
+    def __init__(self, redis_url: str, queue_size: int = 100):
+        self.redis_url = redis_url
+        self.queue_size = queue_size
+        self._queues: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._listener: Optional[asyncio.Task] = None
+        # Set while Redis has confirmed the pattern subscription.
+        self._subscribed = asyncio.Event()
+
+    @property
+    def watcher_count(self) -> int:
+        return sum(len(queues) for queues in self._queues.values())
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Yield a queue of decoded updates for one task until the block exits.
+
+        The queue is handed out only once the pattern subscription is live,
+        so nothing published after subscribe() returns can be missed.
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[task_id].add(queue)
+        try:
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+            await self._subscribed.wait()
+            yield queue
+        finally:
+            queues = self._queues.get(task_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._queues[task_id]
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._subscribed = asyncio.Event()
+
+    async def _listen(self) -> None:
+        while True:
+            redis = aioredis.from_url(self.redis_url)
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+                    elif message["type"] == "psubscribe":
+                        self._subscribed.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                settings.logger.warning(f"Task updates subscription lost: {e}")
+                self._subscribed.clear()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                await pubsub.aclose()
+                await redis.aclose()
+
+    def _dispatch(self, channel: bytes, data: bytes) -> None:
+        task_id = channel.decode()[len(CHANNEL_PREFIX):]
+        queues = self._queues.get(task_id)
+        if not queues:
+            return
+        try:
+            update = json.loads(data)
+        except ValueError:
+            return
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(update)
+
+
+task_updates = TaskUpdatesHub(settings.CELERY_BROKER_URL)
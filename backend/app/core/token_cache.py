@@ -0,0 +1,64 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+from app.core.config import settings
+
+
+class TokenCache:
+    """Bounded LRU of already verified JWTs, keyed by a digest of the token.
+
+    An entry lives until the token's exp claim. Entries are tied to the
+    signing key and algorithm they were verified with: when either changes,
+    the cache is emptied so nothing verified with an old key is trusted.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._signing_key = None
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def _check_signing_key(self) -> None:
+        signing_key = (settings.JWT_SECRET_KEY, settings.TOKEN_ALGORITHM)
+        if signing_key != self._signing_key:
+            self._entries.clear()
+            self._signing_key = signing_key
+
+    def get(self, token: str) -> Optional[Any]:
+        """Return the cached claims of a verified, unexpired token, or None."""
+        key = self.key(token)
+        with self._lock:
+            self._check_signing_key()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, token: str, claims: Any, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        key = self.key(token)
+        with self._lock:
+            self._check_signing_key()
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache(max_size=int(settings.TOKEN_CACHE_MAX_SIZE))
@@ -0,0 +1,120 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+
+class UserCache:
+    """Two-tier cache of user records keyed by user id.
+
+    The first tier is an in-process LRU whose entries expire after
+    local_ttl seconds; the optional second tier is Redis, shared by every
+    API replica. Writers invalidate both tiers of their own process; other
+    replicas see the change once their short local TTL runs out.
+    """
+
+    def __init__(
+        self,
+        local_ttl: float,
+        max_size: int,
+        redis_url: Optional[str] = None,
+        redis_ttl: int = 300,
+    ):
+        self.local_ttl = local_ttl
+        self.max_size = max_size
+        self.redis_url = redis_url
+        self.redis_ttl = redis_ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+
+    @staticmethod
+    def key(user_id) -> str:
+        return f"user_cache:{user_id}"
+
+    def _get_redis(self):
+        if self._redis is None and self.redis_url:
+            self._redis = aioredis.from_url(self.redis_url)
+        return self._redis
+
+    def _get_local(self, user_id: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, record = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return record
+
+    def _set_local(self, user_id: str, record: Dict) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.local_ttl, record)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    async def get(self, user_id) -> Optional[Dict]:
+        user_id = str(user_id)
+        record = self._get_local(user_id)
+        if record is not None:
+            return record
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        try:
+            value = await redis.get(self.key(user_id))
+        except Exception as e:
+            settings.logger.warning(f"User cache read failed: {e}")
+            return None
+        if value is None:
+            return None
+        record = json.loads(value)
+        self._set_local(user_id, record)
+        return record
+
+    async def set(self, user_id, record: Dict) -> None:
+        user_id = str(user_id)
+        self._set_local(user_id, record)
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(self.key(user_id), json.dumps(record), ex=self.redis_ttl)
+        except Exception as e:
+            settings.logger.warning(f"User cache write failed: {e}")
+
+    async def invalidate(self, user_id) -> None:
+        user_id = str(user_id)
+        with self._lock:
+            self._entries.pop(user_id, None)
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(self.key(user_id))
+        except Exception as e:
+            settings.logger.warning(f"User cache invalidation failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def close(self) -> None:
+        """Close the Redis connection; the next use opens a new one."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+user_cache = UserCache(
+    local_ttl=float(settings.USER_CACHE_LOCAL_TTL_SECONDS),
+    max_size=int(settings.USER_CACHE_MAX_SIZE),
+    redis_url=settings.REDIS_URL if settings.USER_CACHE_REDIS_ENABLED else None,
+    redis_ttl=int(settings.USER_CACHE_REDIS_TTL_SECONDS),
+)
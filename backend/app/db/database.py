@@ -1,11 +1,126 @@
+import time
+import threading
+from contextvars import ContextVar
+from typing import Dict
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
 
 
 DATABASE_URL = settings.POSTGRES_DSN
 
-engine = create_async_engine(DATABASE_URL)
+
+class PoolWaitStats:
+    """Time spent waiting for pool checkouts, kept across pool re-creation.
+
+    Queue wait and the time spent opening new connections are counted
+    separately: a checkout that finds the pool empty but may overflow
+    connects instead of waiting, and that cost is the database's, not the
+    pool's.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.connects = 0
+        self.total_connect = 0.0
+        self.max_connect = 0.0
+
+    def record(self, wait: float, connect: float = 0.0, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if connect:
+                self.connects += 1
+                self.total_connect += connect
+                self.max_connect = max(self.max_connect, connect)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+                "mean_wait_ms": round(
+                    self.total_wait * 1000 / self.checkouts if self.checkouts else 0.0, 3
+                ),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "connects": self.connects,
+                "total_connect_ms": round(self.total_connect * 1000, 3),
+                "mean_connect_ms": round(
+                    self.total_connect * 1000 / self.connects if self.connects else 0.0, 3
+                ),
+                "max_connect_ms": round(self.max_connect * 1000, 3),
+            }
+
+
+pool_wait_stats = PoolWaitStats()
+
+# Time the current checkout spent opening a new connection. Each asyncio
+# task (and greenlet) has its own context, so concurrent checkouts don't mix.
+_connect_time: ContextVar[float] = ContextVar("pool_connect_time", default=0.0)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waits."""
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            _connect_time.set(time.perf_counter() - started)
+
+    def _do_get(self):
+        _connect_time.set(0.0)
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        connect = _connect_time.get()
+        pool_wait_stats.record(time.perf_counter() - started - connect, connect)
+        return connection
+
+
+def get_pool_options(profile: str) -> Dict:
+    """Return the create_async_engine pool arguments of the api or worker profile.
+
+    The API pool keeps MIN_CONNECTIONS_COUNT connections and may grow to
+    MAX_CONNECTIONS_COUNT; each worker child runs one task at a time, so it
+    gets its own small pool.
+    """
+    if profile == "worker":
+        pool_size = int(settings.WORKER_DB_POOL_SIZE)
+        max_overflow = int(settings.WORKER_DB_MAX_OVERFLOW)
+    else:
+        pool_size = int(settings.MIN_CONNECTIONS_COUNT)
+        max_overflow = max(0, int(settings.MAX_CONNECTIONS_COUNT) - pool_size)
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": float(settings.DB_POOL_TIMEOUT_SECONDS),
+        "pool_recycle": int(settings.DB_POOL_RECYCLE_SECONDS),
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+engine = create_async_engine(
+    make_url(DATABASE_URL).update_query_dict(
+        {"prepared_statement_cache_size": str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)}
+    ),
+    **get_pool_options(settings.DB_POOL_PROFILE),
+)
 
 SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
 
@@ -14,11 +129,31 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db():
+def get_pool_metrics() -> Dict:
+    """Return the current state of the connection pool and its checkout wait times."""
+    pool = engine.pool
+    return {
+        "profile": settings.DB_POOL_PROFILE,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": pool._max_overflow,
+        "wait": pool_wait_stats.to_dict(),
+    }
+
+
+async def connect_and_init_db():
+    """Create any missing tables; run once at API and worker startup."""
+    # Every model must be imported so its table is registered on Base.
+    from app.models import user, validation  # noqa: F401
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    db = SessionLocal()
-    try:
+
+
+async def get_db():
+    # FastAPI caches dependencies per request, so a route and
+    # authenticate_current_user that both depend on get_db share this session.
+    async with SessionLocal() as db:
         yield db
-    finally:
-        await db.close()
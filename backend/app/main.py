@@ -1,5 +1,5 @@
-import json
-import redis.asyncio as aioredis
+import asyncio
+from contextlib import asynccontextmanager
 from typing import Dict
 from jose import JWTError
 from pydantic import ValidationError
@@ -14,15 +14,29 @@ from fastapi import (
 from fastapi.middleware.cors import CORSMiddleware
 from celery.result import AsyncResult
 from app.core.config import settings
+from app.core.password_hasher import password_hasher
+from app.core.task_updates import task_updates
+from app.core.user_cache import user_cache
 from app.api.router import router
+from app.db.database import SessionLocal, connect_and_init_db, engine, get_pool_metrics
 from app.models.user import User
 from app.services.user import UserService
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await connect_and_init_db()
+    yield
+    await task_updates.close()
+    await user_cache.close()
+    await engine.dispose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/",
+    lifespan=lifespan,
 )
 app.include_router(router, prefix=settings.API_V1_STR)
 app.add_middleware(
@@ -38,6 +52,20 @@ async def test():
     return {"message": "pong!"}
 
 
+@app.get("/db_pool_metrics")
+async def db_pool_metrics(
+    _: User = Depends(UserService.authenticate_current_user),
+) -> Dict:
+    return get_pool_metrics()
+
+
+@app.get("/password_hasher_metrics")
+async def password_hasher_metrics(
+    _: User = Depends(UserService.authenticate_current_user),
+) -> Dict:
+    return password_hasher.metrics()
+
+
 @app.delete(
     "/reset_database",
     summary="Delete All Data",
@@ -72,21 +100,31 @@ def task_status(task_id: str, _: User = Depends(UserService.authenticate_current
         )
 
 
+async def wait_for_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
 @app.websocket("/websocket_task_status/{task_id}")
 async def websocket_task_status(websocket: WebSocket, task_id: str):
-    redis = aioredis.from_url(settings.CELERY_BROKER_URL)
+    disconnected = None
     try:
         await websocket.accept()
         token_message = await websocket.receive_text()
-        await UserService.authenticate_current_user(token_message)
-        pubsub = redis.pubsub()
-        await pubsub.subscribe(f"task_updates:{task_id}")
-        while True:
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True, timeout=1.0
-            )
-            if message:
-                task_status = json.loads(message["data"])
+        async with SessionLocal() as db:
+            await UserService.authenticate_current_user(token_message, db=db)
+        disconnected = asyncio.create_task(wait_for_disconnect(websocket))
+        async with task_updates.subscribe(task_id) as updates:
+            while True:
+                update = asyncio.create_task(updates.get())
+                await asyncio.wait(
+                    {update, disconnected}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not update.done():
+                    update.cancel()
+                    break
+
+                task_status = update.result()
                 await websocket.send_json(task_status)
 
                 if task_status.get("status") in ["SUCCESS", "FAILURE"]:
@@ -97,5 +135,5 @@ async def websocket_task_status(websocket: WebSocket, task_id: str):
     except (JWTError, ValidationError):
         await websocket.close()
     finally:
-        await pubsub.unsubscribe(f"task_updates:{task_id}")
-        await pubsub.close()
+        if disconnected is not None:
+            disconnected.cancel()
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.db.database import Base
+
+
+class ValidationRun(Base):
+    __tablename__ = "validation_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
+    task_id: Mapped[str] = mapped_column(unique=True, index=True, nullable=False)
+    user_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), index=True, nullable=True
+    )
+    document_hash: Mapped[str] = mapped_column(index=True, nullable=False)
+    page_count: Mapped[int] = mapped_column(nullable=False)
+    passed: Mapped[bool] = mapped_column(nullable=False)
+    finding_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    date_created: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    expires_at: Mapped[datetime] = mapped_column(index=True, nullable=False)
+
+    findings: Mapped[List["ValidationFinding"]] = relationship(
+        back_populates="run", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+
+class ValidationFinding(Base):
+    __tablename__ = "validation_findings"
+    __table_args__ = (
+        Index("ix_validation_findings_rule_code", "rule", "code"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(
+        ForeignKey("validation_runs.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    rule: Mapped[str] = mapped_column(nullable=False)
+    section: Mapped[str] = mapped_column(nullable=False)
+    page: Mapped[Optional[int]] = mapped_column(nullable=True)
+    severity: Mapped[str] = mapped_column(nullable=False)
+    code: Mapped[str] = mapped_column(nullable=False)
+    message: Mapped[str] = mapped_column(nullable=False)
+
+    run: Mapped[ValidationRun] = relationship(back_populates="findings")
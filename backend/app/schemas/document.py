@@ -0,0 +1,42 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class DocumentUploadResponse(BaseModel):
+    task_id: str
+    document_hash: str
+    filename: str
+    page_count: int
+    size: int
+    status: str = "PENDING"
+    deduplicated: bool = False
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BatchSubmitResponse(BaseModel):
+    batch_id: str
+    items: List[DocumentUploadResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BulkTaskStatusRequest(BaseModel):
+    task_ids: List[str]
+
+
+class TaskStatusItem(BaseModel):
+    task_id: str
+    status: str
+    passed: Optional[bool] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BulkTaskStatusResponse(BaseModel):
+    total: int
+    counts: Dict[str, int]
+    items: List[TaskStatusItem]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,3 @@
-from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, EmailStr
 
@@ -53,7 +52,7 @@ class TokenResponse(BaseModel):
 
 
 class TokenRequest(BaseModel):
-    sub: UUID
+    sub: int
     exp: int
 
     model_config = ConfigDict(from_attributes=True)
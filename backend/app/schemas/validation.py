@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class ValidationFindingResponse(BaseModel):
+    rule: str
+    section: str
+    page: Optional[int]
+    severity: str
+    code: str
+    message: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ValidationRunResponse(BaseModel):
+    id: int
+    task_id: str
+    user_id: Optional[int]
+    document_hash: str
+    page_count: int
+    passed: bool
+    finding_count: int
+    date_created: datetime
+    expires_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ValidationRunDetailResponse(ValidationRunResponse):
+    findings: List[ValidationFindingResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RuleFindingResponse(ValidationFindingResponse):
+    run_id: int
+
+    model_config = ConfigDict(from_attributes=True)
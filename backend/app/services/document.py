@@ -0,0 +1,357 @@
+import os
+import re
+import uuid
+import hashlib
+import tempfile
+from collections import Counter
+from typing import AsyncIterator, Dict, List, Optional
+import fitz
+from fastapi import HTTPException, Request, UploadFile, status
+from starlette.concurrency import run_in_threadpool
+from celery import states
+from celery.result import AsyncResult
+from app.core.config import settings
+from app.schemas.document import (
+    DocumentUploadResponse,
+    BatchSubmitResponse,
+    TaskStatusItem,
+    BulkTaskStatusResponse,
+)
+from app.tasks.routing import route_for_document, time_limits_for_document
+from app.tasks.ruleset import get_ruleset_version
+
+
+DOCUMENT_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+UPLOAD_FILE_CHUNK_SIZE = 1024 * 1024
+
+
+class DocumentService:
+    @staticmethod
+    def get_document_path(document_hash: str) -> str:
+        return os.path.join(settings.UPLOAD_DIR, f"{document_hash}.pdf")
+
+    @staticmethod
+    def get_submission_key(document_hash: str, user_id: Optional[int] = None) -> str:
+        return f"validation_submission:{user_id}:{document_hash}:{get_ruleset_version()}"
+
+    @staticmethod
+    def get_batch_key(batch_id: str) -> str:
+        return f"task_batch:{batch_id}"
+
+    @staticmethod
+    async def store_upload(request: Request) -> Dict:
+        """Stream the request body to the content-addressed upload store."""
+        return await DocumentService.store_stream(request.stream())
+
+    @staticmethod
+    async def store_upload_file(file: UploadFile) -> Dict:
+        async def chunks() -> AsyncIterator[bytes]:
+            while chunk := await file.read(UPLOAD_FILE_CHUNK_SIZE):
+                yield chunk
+
+        return await DocumentService.store_stream(chunks())
+
+    @staticmethod
+    async def store_stream(chunks: AsyncIterator[bytes]) -> Dict:
+        """Write a PDF to the content-addressed upload store.
+
+        The chunks are hashed while they are written to a temporary file, so
+        the PDF is never held in memory; once it opens as a PDF the file is
+        renamed to its digest.
+        """
+        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        file = tempfile.NamedTemporaryFile(
+            dir=settings.UPLOAD_DIR, suffix=".part", delete=False
+        )
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                if size > int(settings.MAX_UPLOAD_BYTES):
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Documents are limited to {settings.MAX_UPLOAD_BYTES} bytes",
+                    )
+                await run_in_threadpool(file.write, chunk)
+            file.close()
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+
+        try:
+            if size == 0:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Empty upload"
+                )
+            page_count = await run_in_threadpool(
+                DocumentService.get_page_count, file.name
+            )
+            if page_count > int(settings.MAX_UPLOAD_PAGES):
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Documents are limited to {settings.MAX_UPLOAD_PAGES} pages",
+                )
+        except BaseException:
+            os.remove(file.name)
+            raise
+
+        document_hash = digest.hexdigest()
+        file_path = DocumentService.get_document_path(document_hash)
+        os.replace(file.name, file_path)
+        return {
+            "document_hash": document_hash,
+            "file_path": file_path,
+            "size": size,
+            "page_count": page_count,
+        }
+
+    @staticmethod
+    def get_page_count(file_path: str) -> int:
+        try:
+            with fitz.open(file_path, filetype="pdf") as doc:
+                return doc.page_count
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid PDF document",
+            ) from e
+
+    @staticmethod
+    def enqueue_validation(
+        file_path: str,
+        document_hash: str,
+        user_id: Optional[int] = None,
+        page_count: int = 0,
+        size: int = 0,
+        previous_hash: Optional[str] = None,
+    ) -> Dict:
+        """Queue a validation unless one for this PDF and ruleset already exists.
+
+        Submissions are keyed by (user, document hash, ruleset version): a
+        repeat submission attaches to the queued or running task, or gets the
+        finished task whose result is still stored. Only failed or revoked
+        tasks, and reports cut short at the soft time limit, are run again.
+        Each submitter gets a task, and so a validation run, of their own;
+        the extraction store still spares a second user's run from
+        extracting the PDF again.
+        """
+        try:
+            key = DocumentService.get_submission_key(document_hash, user_id)
+            redis_client = settings.redis_client
+            while True:
+                existing = redis_client.get(key)
+                if existing is not None:
+                    task_id = existing.decode()
+                    result = AsyncResult(task_id, app=settings.celery)
+                    state = result.state
+                    partial = (
+                        state == states.SUCCESS
+                        and isinstance(result.result, dict)
+                        and result.result.get("partial")
+                    )
+                    if state not in (states.FAILURE, states.REVOKED) and not partial:
+                        return {"task_id": task_id, "status": state, "deduplicated": True}
+                    # Only the submitter that clears the failed task retries it.
+                    if not redis_client.delete(key):
+                        continue
+
+                task_id = str(uuid.uuid4())
+                if redis_client.set(
+                    key, task_id, nx=True, ex=int(settings.CELERY_RESULT_EXPIRES)
+                ):
+                    break
+
+            try:
+                settings.celery.send_task(
+                    "validate_document",
+                    args=[file_path, document_hash, user_id, previous_hash],
+                    task_id=task_id,
+                    **route_for_document(page_count, size),
+                    **time_limits_for_document(page_count),
+                )
+            except Exception:
+                redis_client.delete(key)
+                raise
+            return {"task_id": task_id, "status": states.PENDING, "deduplicated": False}
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+
+    @staticmethod
+    async def upload_document(
+        request: Request,
+        filename: str,
+        user_id: Optional[int] = None,
+        previous_hash: Optional[str] = None,
+    ) -> DocumentUploadResponse:
+        if previous_hash is not None and not DOCUMENT_HASH_PATTERN.match(previous_hash):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid document hash: {previous_hash}",
+            )
+        upload = await DocumentService.store_upload(request)
+        submission = await run_in_threadpool(
+            DocumentService.enqueue_validation,
+            upload["file_path"],
+            upload["document_hash"],
+            user_id,
+            upload["page_count"],
+            upload["size"],
+            previous_hash,
+        )
+        return DocumentUploadResponse(
+            **submission,
+            document_hash=upload["document_hash"],
+            filename=filename,
+            page_count=upload["page_count"],
+            size=upload["size"],
+        )
+
+    @staticmethod
+    def get_stored_document(document_hash: str) -> Dict:
+        """Return the upload-store entry of a previously uploaded document."""
+        if not DOCUMENT_HASH_PATTERN.match(document_hash):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid document hash: {document_hash}",
+            )
+        file_path = DocumentService.get_document_path(document_hash)
+        if not os.path.exists(file_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Document not found: {document_hash}",
+            )
+        return {
+            "document_hash": document_hash,
+            "file_path": file_path,
+            "size": os.path.getsize(file_path),
+            "page_count": DocumentService.get_page_count(file_path),
+        }
+
+    @staticmethod
+    async def submit_batch(
+        files: List[UploadFile], document_hashes: List[str], user_id: Optional[int] = None
+    ) -> BatchSubmitResponse:
+        """Queue a validation per document and record the tasks under one batch id.
+
+        Every document is stored or looked up before anything is queued, so
+        a bad entry rejects the batch without leaving half of it running.
+        """
+        count = len(files) + len(document_hashes)
+        if not count or count > int(settings.BATCH_MAX_DOCUMENTS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A batch takes 1 to {settings.BATCH_MAX_DOCUMENTS} documents",
+            )
+
+        documents = []
+        for file in files:
+            upload = await DocumentService.store_upload_file(file)
+            documents.append((file.filename or "document.pdf", upload))
+        for document_hash in document_hashes:
+            upload = await run_in_threadpool(
+                DocumentService.get_stored_document, document_hash
+            )
+            documents.append((f"{document_hash}.pdf", upload))
+
+        items = []
+        for filename, upload in documents:
+            submission = await run_in_threadpool(
+                DocumentService.enqueue_validation,
+                upload["file_path"],
+                upload["document_hash"],
+                user_id,
+                upload["page_count"],
+                upload["size"],
+            )
+            items.append(
+                DocumentUploadResponse(
+                    **submission,
+                    document_hash=upload["document_hash"],
+                    filename=filename,
+                    page_count=upload["page_count"],
+                    size=upload["size"],
+                )
+            )
+
+        batch_id = str(uuid.uuid4())
+        await run_in_threadpool(
+            DocumentService.save_batch, batch_id, [item.task_id for item in items]
+        )
+        return BatchSubmitResponse(batch_id=batch_id, items=items)
+
+    @staticmethod
+    def save_batch(batch_id: str, task_ids: List[str]) -> None:
+        try:
+            key = DocumentService.get_batch_key(batch_id)
+            with settings.redis_client.pipeline() as pipe:
+                pipe.rpush(key, *task_ids)
+                pipe.expire(key, int(settings.CELERY_RESULT_EXPIRES))
+                pipe.execute()
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+
+    @staticmethod
+    def get_batch_task_ids(batch_id: str) -> List[str]:
+        try:
+            task_ids = settings.redis_client.lrange(
+                DocumentService.get_batch_key(batch_id), 0, -1
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+        if not task_ids:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        return [task_id.decode() for task_id in task_ids]
+
+    @staticmethod
+    def get_tasks_status(task_ids: List[str]) -> BulkTaskStatusResponse:
+        """Resolve many task states with a single MGET on the result backend."""
+        if len(task_ids) > int(settings.BATCH_MAX_DOCUMENTS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {settings.BATCH_MAX_DOCUMENTS} task ids per request",
+            )
+        try:
+            backend = settings.celery.backend
+            values = (
+                backend.mget([backend.get_key_for_task(task_id) for task_id in task_ids])
+                if task_ids
+                else []
+            )
+            items = []
+            for task_id, value in zip(task_ids, values):
+                item = TaskStatusItem(task_id=task_id, status="PENDING")
+                if value is not None:
+                    meta = backend.decode(value)
+                    result = meta.get("result")
+                    item.status = meta["status"]
+                    if item.status == "SUCCESS" and isinstance(result, dict):
+                        item.passed = result.get("passed")
+                    elif item.status == "FAILURE" and isinstance(result, dict):
+                        message = result.get("exc_message", "")
+                        if isinstance(message, (list, tuple)):
+                            message = ", ".join(str(part) for part in message)
+                        item.error = str(message)
+                items.append(item)
+            return BulkTaskStatusResponse(
+                total=len(items),
+                counts=dict(Counter(item.status for item in items)),
+                items=items,
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
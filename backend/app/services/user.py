@@ -1,10 +1,10 @@
 import re
+import time
 import smtplib
-from typing import Optional, Union, Any, Dict, List
+from typing import Optional, Union, Any, Dict, List, Tuple
 from datetime import datetime, timedelta
 from pytz import timezone
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from fastapi import Depends, HTTPException, status
@@ -13,6 +13,9 @@ from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.password_hasher import password_hasher, PasswordHasherBusy
+from app.core.token_cache import token_cache
+from app.core.user_cache import user_cache
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.user import (
@@ -25,16 +28,22 @@ from app.schemas.user import (
     TokenResponse,
 )
 
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class UserService:
     @staticmethod
-    def verify_password(password: str, hashed_password: str) -> bool:
+    async def verify_password(
+        password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Check a password, returning a new hash too if the stored one is outdated."""
         try:
-            verification = password_context.verify(password, hashed_password)
+            verification = await password_hasher.verify_and_update(
+                password, hashed_password
+            )
             return verification
 
+        except PasswordHasherBusy as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -57,11 +66,15 @@ class UserService:
             )
 
     @staticmethod
-    def get_password(password: str) -> str:
+    async def get_password(password: str) -> str:
         try:
-            password = password_context.hash(password)
+            password = await password_hasher.hash(password)
             return password
 
+        except PasswordHasherBusy as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -78,8 +91,9 @@ class UserService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="User does not exist",
                 )
-            user.password = UserService.get_password(password=password)
+            user.password = await UserService.get_password(password=password)
             await db.commit()
+            await UserService.invalidate_cached_user(user.id)
             return user
 
         except Exception as e:
@@ -96,11 +110,43 @@ class UserService:
                 raise HTTPException(status_code=404, detail="User not found")
             return user
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
             )
 
+    @staticmethod
+    async def get_cached_user(id: int, db: AsyncSession) -> User:
+        """Return a user from the user cache, loading and caching it on a miss.
+
+        Cached users are detached and carry no password hash.
+        """
+        record = await user_cache.get(id)
+        if record is not None:
+            return User(
+                **dict(record, date_created=datetime.fromisoformat(record["date_created"]))
+            )
+        user = await UserService.get_user_by_id(id=id, db=db)
+        await user_cache.set(
+            user.id,
+            {
+                "id": user.id,
+                "username": user.username,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "email": user.email,
+                "date_created": user.date_created.isoformat(),
+            },
+        )
+        return user
+
+    @staticmethod
+    async def invalidate_cached_user(id: int) -> None:
+        """Drop a user from the user cache; call after every change to a user."""
+        await user_cache.invalidate(id)
+
     @staticmethod
     async def get_user_by_email(email: str, db: AsyncSession) -> UserResponse:
         try:
@@ -110,6 +156,8 @@ class UserService:
                 raise HTTPException(status_code=404, detail="User not found")
             return user
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -138,6 +186,8 @@ class UserService:
                     detail="Email already exists. Please use a different email address.",
                 )
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -148,17 +198,34 @@ class UserService:
         email: str, password: str, db: AsyncSession
     ) -> Optional[User]:
         try:
-            user = await UserService.get_user_by_email(email=email, db=db)
-            if not user or not UserService.verify_password(
-                password=password, hashed_password=user.password
-            ):
+            try:
+                user = await UserService.get_user_by_email(email=email, db=db)
+            except HTTPException as e:
+                # An unknown email is reported like a wrong password.
+                if e.status_code != status.HTTP_404_NOT_FOUND:
+                    raise
+                user = None
+            verified, new_hash = (
+                await UserService.verify_password(
+                    password=password, hashed_password=user.password
+                )
+                if user
+                else (False, None)
+            )
+            if not verified:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Incorrect email or password",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
+            if new_hash:
+                # Stored with an outdated cost; upgrade it now that we know the password.
+                user.password = new_hash
+                await db.commit()
             return user
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -166,11 +233,17 @@ class UserService:
 
     @staticmethod
     def verify_and_decode_token(token: str) -> TokenRequest:
+        token_data = token_cache.get(token)
+        if token_data is not None:
+            return token_data
+
         try:
             payload = jwt.decode(
                 token, settings.JWT_SECRET_KEY, algorithms=[settings.TOKEN_ALGORITHM]
             )
-            return TokenRequest(**payload)
+            token_data = TokenRequest(**payload)
+            token_cache.set(token, token_data, expires_at=token_data.exp)
+            return token_data
 
         except (JWTError, ValidationError) as e:
             raise HTTPException(
@@ -182,7 +255,7 @@ class UserService:
     @staticmethod
     def validate_token_expiry(token_data: TokenRequest) -> None:
         try:
-            if datetime.fromtimestamp(token_data.exp) < datetime.now():
+            if token_data.exp < time.time():
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token Expired",
@@ -206,7 +279,7 @@ class UserService:
         try:
             token_data = UserService.verify_and_decode_token(token=token)
             UserService.validate_token_expiry(token_data=token_data)
-            user = await UserService.get_user_by_id(token_data.sub, db=db)
+            user = await UserService.get_cached_user(token_data.sub, db=db)
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Could Not Find User"
@@ -318,7 +391,7 @@ class UserService:
         UserService.validate_password(data.password)
 
         try:
-            hashed_password = UserService.get_password(password=data.password)
+            hashed_password = await UserService.get_password(password=data.password)
             user = User(
                 email=data.email,
                 username=data.username,
@@ -329,6 +402,7 @@ class UserService:
             db.add(user)
             await db.commit()
             await db.refresh(user)
+            await UserService.invalidate_cached_user(user.id)
             return user
 
         except Exception as e:
@@ -393,7 +467,7 @@ class UserService:
     @staticmethod
     async def forgot_user_password(data: ForgotPasswordRequest, db: AsyncSession):
         try:
-            user = await UserService.get_user_by_email(email=data.email)
+            user = await UserService.get_user_by_email(email=data.email, db=db)
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Incorrect Email"
@@ -406,6 +480,8 @@ class UserService:
                 "message": "Reset password link has been sent to your email address"
             }
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -0,0 +1,155 @@
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from fastapi import HTTPException, status
+from sqlalchemy import select, insert, delete, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.core.config import settings
+from app.models.validation import ValidationRun, ValidationFinding
+from app.schemas.validation import (
+    ValidationRunResponse,
+    ValidationRunDetailResponse,
+    RuleFindingResponse,
+)
+
+
+class ValidationService:
+    @staticmethod
+    async def save_run(
+        task_id: str, report: Dict, user_id: Optional[int], db: AsyncSession
+    ) -> int:
+        """Store a merged report as one run row plus one batched findings insert.
+
+        A retried task replaces its earlier run, and runs past their TTL are
+        purged in the same transaction.
+        """
+        findings = [
+            finding for check in report["checks"] for finding in check.get("findings", [])
+        ]
+        now = datetime.utcnow()
+        await db.execute(
+            delete(ValidationRun).where(
+                or_(ValidationRun.task_id == task_id, ValidationRun.expires_at < now)
+            )
+        )
+        run_id = await db.scalar(
+            insert(ValidationRun)
+            .values(
+                task_id=task_id,
+                user_id=user_id,
+                document_hash=report["document_hash"],
+                page_count=report["page_count"],
+                passed=report["passed"],
+                finding_count=len(findings),
+                date_created=now,
+                expires_at=now + timedelta(days=int(settings.VALIDATION_RESULT_TTL_DAYS)),
+            )
+            .returning(ValidationRun.id)
+        )
+        if findings:
+            await db.execute(
+                insert(ValidationFinding),
+                [{"run_id": run_id, **finding} for finding in findings],
+            )
+        await db.commit()
+        return run_id
+
+    @staticmethod
+    async def get_runs_by_user(
+        user_id: int, db: AsyncSession, limit: int = 50, offset: int = 0
+    ) -> List[ValidationRunResponse]:
+        try:
+            result = await db.execute(
+                select(ValidationRun)
+                .where(
+                    ValidationRun.user_id == user_id,
+                    ValidationRun.expires_at > datetime.utcnow(),
+                )
+                .order_by(ValidationRun.date_created.desc())
+                .limit(limit)
+                .offset(offset)
+            )
+            return result.scalars().all()
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+
+    @staticmethod
+    async def get_runs_by_document(
+        document_hash: str, user_id: int, db: AsyncSession
+    ) -> List[ValidationRunResponse]:
+        try:
+            result = await db.execute(
+                select(ValidationRun)
+                .where(
+                    ValidationRun.document_hash == document_hash,
+                    ValidationRun.user_id == user_id,
+                    ValidationRun.expires_at > datetime.utcnow(),
+                )
+                .order_by(ValidationRun.date_created.desc())
+            )
+            return result.scalars().all()
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+
+    @staticmethod
+    async def get_run_by_task_id(
+        task_id: str, user_id: int, db: AsyncSession
+    ) -> ValidationRunDetailResponse:
+        try:
+            result = await db.execute(
+                select(ValidationRun)
+                .options(selectinload(ValidationRun.findings))
+                .where(
+                    ValidationRun.task_id == task_id,
+                    ValidationRun.user_id == user_id,
+                    ValidationRun.expires_at > datetime.utcnow(),
+                )
+            )
+            run = result.scalars().first()
+            if not run:
+                raise HTTPException(status_code=404, detail="Validation run not found")
+            return run
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+
+    @staticmethod
+    async def get_findings_by_rule(
+        rule: str,
+        user_id: int,
+        db: AsyncSession,
+        code: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[RuleFindingResponse]:
+        try:
+            query = (
+                select(ValidationFinding)
+                .join(ValidationRun)
+                .where(
+                    ValidationFinding.rule == rule,
+                    ValidationRun.user_id == user_id,
+                    ValidationRun.expires_at > datetime.utcnow(),
+                )
+            )
+            if code is not None:
+                query = query.where(ValidationFinding.code == code)
+            result = await db.execute(
+                query.order_by(ValidationFinding.id.desc()).limit(limit).offset(offset)
+            )
+            return result.scalars().all()
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
@@ -0,0 +1,112 @@
+import json
+import time
+from typing import Dict, Optional
+from redis import Redis
+from app.core.config import settings
+
+
+PROGRESS_TTL_SECONDS = 24 * 60 * 60
+
+
+def progress_key(task_id: str) -> str:
+    return f"task_progress:{task_id}"
+
+
+def progress_channel(task_id: str) -> str:
+    return f"task_updates:{task_id}"
+
+
+class ProgressPublisher:
+    """Publishes validation progress for one task to its task_updates channel.
+
+    Counters live in the task_progress:{task_id} hash so every section job of
+    a chord adds to the same totals. Messages are throttled to max_rate per
+    second per task across all workers: each job keeps its deltas locally and
+    only the job that wins the Redis rate gate flushes and publishes. A job
+    tries the gate at most once per interval, so most pages touch no Redis.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        redis_client: Redis = settings.redis_client,
+        max_rate: float = settings.TASK_PROGRESS_MAX_RATE,
+    ):
+        self.task_id = task_id
+        self.redis = redis_client
+        self.interval_ms = max(1, int(1000 / float(max_rate)))
+        self.stage = None
+        self._pages = 0
+        self._rules = 0
+        self._next_gate_check = 0.0
+
+    def start(self, pages_total: int, rules_total: int) -> None:
+        """Reset the counters of a task and publish its first snapshot."""
+        key = progress_key(self.task_id)
+        with self.redis.pipeline() as pipe:
+            pipe.delete(key)
+            pipe.hset(
+                key,
+                mapping={
+                    "stage": "queued",
+                    "pages_done": 0,
+                    "pages_total": pages_total,
+                    "rules_done": 0,
+                    "rules_total": rules_total,
+                },
+            )
+            pipe.expire(key, PROGRESS_TTL_SECONDS)
+            pipe.execute()
+        self._publish("PROGRESS", self._snapshot())
+
+    def __call__(self, stage: str, pages: int = 0, rules: int = 0) -> None:
+        """Record progress, publishing only if the task's rate gate is open."""
+        self.stage = stage
+        self._pages += pages
+        self._rules += rules
+        now = time.monotonic()
+        if now < self._next_gate_check:
+            return
+        self._next_gate_check = now + self.interval_ms / 1000
+        if self.redis.set(
+            f"task_progress_lock:{self.task_id}", 1, nx=True, px=self.interval_ms
+        ):
+            self._publish("PROGRESS", self.flush())
+
+    def flush(self) -> Dict:
+        """Add the locally buffered deltas to the task's counters and return a snapshot."""
+        key = progress_key(self.task_id)
+        with self.redis.pipeline() as pipe:
+            if self._pages:
+                pipe.hincrby(key, "pages_done", self._pages)
+            if self._rules:
+                pipe.hincrby(key, "rules_done", self._rules)
+            if self.stage is not None:
+                pipe.hset(key, "stage", self.stage)
+            pipe.hgetall(key)
+            snapshot = pipe.execute()[-1]
+        self._pages = self._rules = 0
+        return self._decode(snapshot)
+
+    def finish(self, status: str = "SUCCESS", result: Optional[Dict] = None) -> None:
+        """Publish the terminal status of a task, bypassing the rate gate."""
+        snapshot = self.flush()
+        if result is not None:
+            snapshot["result"] = result
+        self._publish(status, snapshot)
+
+    def _snapshot(self) -> Dict:
+        return self._decode(self.redis.hgetall(progress_key(self.task_id)))
+
+    @staticmethod
+    def _decode(snapshot: Dict) -> Dict:
+        decoded = {}
+        for field, value in snapshot.items():
+            field, value = field.decode(), value.decode()
+            decoded[field] = int(value) if value.isdigit() else value
+        return decoded
+
+    def _publish(self, status: str, snapshot: Dict) -> None:
+        message = {"task_id": self.task_id, "status": status, "timestamp": time.time()}
+        message.update(snapshot)
+        self.redis.publish(progress_channel(self.task_id), json.dumps(message))
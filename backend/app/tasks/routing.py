@@ -0,0 +1,26 @@
+from typing import Dict
+from app.core.config import settings
+
+
+def route_for_document(page_count: int, size: int) -> Dict:
+    """Return the queue and priority for validating a document of this size.
+
+    Forms and DMSPs go to the small queue so they are never stuck behind a
+    full application; anything over either threshold is a large job.
+    """
+    if page_count <= int(settings.SMALL_DOCUMENT_MAX_PAGES) and size <= int(
+        settings.SMALL_DOCUMENT_MAX_BYTES
+    ):
+        return {"queue": settings.VALIDATION_SMALL_QUEUE, "priority": 0}
+    return {"queue": settings.VALIDATION_LARGE_QUEUE, "priority": 9}
+
+
+def time_limits_for_document(page_count: int) -> Dict:
+    """Return the soft and hard time limits, in seconds, for validating a document."""
+    soft_time_limit = float(settings.TASK_SOFT_TIME_LIMIT_BASE) + page_count * float(
+        settings.TASK_SOFT_TIME_LIMIT_PER_PAGE
+    )
+    return {
+        "soft_time_limit": soft_time_limit,
+        "time_limit": soft_time_limit + float(settings.TASK_HARD_TIME_LIMIT_GRACE),
+    }
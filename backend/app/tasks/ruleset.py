@@ -0,0 +1,21 @@
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from app.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_ruleset_version() -> str:
+    """Return a digest of every validator source file.
+
+    The validators and the check registry in pipeline.py live in
+    VALIDATORS_DIR, so any change to a rule changes the version and stored
+    results for the old rules stop being reused.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(settings.VALIDATORS_DIR).glob("*.py")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
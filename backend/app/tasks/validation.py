@@ -0,0 +1,164 @@
+import os
+import sys
+from typing import Dict, List, Optional
+from celery import chord
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import task_failure
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services.validation import ValidationService
+from app.tasks.progress import ProgressPublisher
+from app.tasks.routing import route_for_document, time_limits_for_document
+from app.tasks.ruleset import get_ruleset_version
+
+# The validators are plain scripts that import each other by module name.
+if settings.VALIDATORS_DIR not in sys.path:
+    sys.path.append(settings.VALIDATORS_DIR)
+
+from extraction_store import ExtractionStore  # noqa: E402
+from helper import configure_parallel_extraction, open_document_cache  # noqa: E402
+import pipeline  # noqa: E402
+from pipeline import (  # noqa: E402
+    CHECKS,
+    count_section_pages,
+    get_checks,
+    merge_reports,
+    validate_application,
+)
+
+
+celery = settings.celery
+
+configure_parallel_extraction(
+    max_workers=int(settings.PDF_PARALLEL_MAX_WORKERS),
+    page_threshold=int(settings.PDF_PARALLEL_PAGE_THRESHOLD),
+)
+
+extraction_store = None
+
+
+def get_extraction_store() -> ExtractionStore:
+    """Return this process's ExtractionStore, opening it on first use."""
+    global extraction_store
+    if extraction_store is None:
+        extraction_store = ExtractionStore(
+            settings.EXTRACTION_STORE_PATH,
+            max_bytes=int(settings.EXTRACTION_STORE_MAX_BYTES),
+        )
+    return extraction_store
+
+
+def warm_up() -> None:
+    pipeline.warm_up()
+    get_extraction_store()
+
+
+@celery.task(name="validate_document", bind=True)
+def validate_document(
+    self,
+    file_path: str,
+    document_hash: str,
+    user_id: Optional[int] = None,
+    previous_hash: Optional[str] = None,
+) -> Dict:
+    """Fan the registered checks out as one job per section and merge them.
+
+    The chord replaces this task, so its id resolves to the merged report.
+    Progress for every section job is published under this task's id,
+    which is handed to each job as root_id.
+    With previous_hash, checks whose pages are unchanged since that earlier
+    upload reuse its results.
+    """
+    cache = open_document_cache(file_path, store=get_extraction_store())
+    try:
+        # Stored with the document so a later version can be compared with it.
+        cache.get_fingerprints()
+        pages_total = sum(count_section_pages(cache, [check]) for check in CHECKS)
+        # Section jobs stay on the upload's queue and share its time budget.
+        options = route_for_document(len(cache), os.path.getsize(file_path))
+        options.update(time_limits_for_document(len(cache)))
+    finally:
+        cache.close()
+    root_id = self.request.id
+    ProgressPublisher(root_id).start(pages_total, len(CHECKS))
+
+    sections = chord(
+        [
+            validate_section.s(
+                file_path, document_hash, [check["name"]], previous_hash, root_id=root_id
+            ).set(**options)
+            for check in CHECKS
+        ],
+        merge_validation_reports.s(
+            document_hash, user_id, root_id=root_id
+        ).set(**options),
+    )
+    # The single FAILURE publisher for the chord: any failed section or merge
+    # job, including one killed at its hard time limit, fails the chord.
+    sections.link_error(publish_validation_failure.s(root_id=root_id))
+    return self.replace(sections)
+
+
+@celery.task(name="validate_section", bind=True)
+def validate_section(
+    self,
+    file_path: str,
+    document_hash: str,
+    check_names: List[str],
+    previous_hash: Optional[str] = None,
+    root_id: Optional[str] = None,
+) -> Dict:
+    progress = ProgressPublisher(root_id or self.request.root_id)
+    report = validate_application(
+        file_path,
+        checks=get_checks(check_names),
+        store=get_extraction_store(),
+        progress=progress,
+        ruleset=get_ruleset_version(),
+        previous_digest=previous_hash,
+        # Past the soft limit, return the findings so far instead of failing.
+        stop_on=(SoftTimeLimitExceeded,),
+    )
+    progress.flush()
+    return report
+
+
+@celery.task(name="merge_validation_reports", bind=True)
+def merge_validation_reports(
+    self,
+    reports: List[Dict],
+    document_hash: str,
+    user_id: Optional[int] = None,
+    root_id: Optional[str] = None,
+) -> Dict:
+    root_id = root_id or self.request.root_id
+    report = merge_reports(reports)
+    report["document_hash"] = document_hash
+    settings.loop.run_until_complete(save_validation_run(root_id, report, user_id))
+    ProgressPublisher(root_id).finish("SUCCESS", {"passed": report["passed"]})
+    return report
+
+
+@celery.task(name="publish_validation_failure")
+def publish_validation_failure(request, exc, traceback, root_id: str) -> None:
+    """Errback of a validation chord: publish FAILURE on the validation's channel."""
+    ProgressPublisher(root_id).finish("FAILURE", {"error": str(exc)})
+
+
+async def save_validation_run(task_id: str, report: Dict, user_id: Optional[int]) -> int:
+    async with SessionLocal() as db:
+        return await ValidationService.save_run(
+            task_id=task_id, report=report, user_id=user_id, db=db
+        )
+
+
+@task_failure.connect
+def publish_task_failure(sender=None, task_id=None, exception=None, **extra):
+    """Tell watchers of a validation that it failed before reaching its chord.
+
+    Section and merge jobs run inside the chord, whose errback
+    (publish_validation_failure) already publishes their failure.
+    """
+    if sender is None or sender.name != "validate_document":
+        return
+    ProgressPublisher(task_id).finish("FAILURE", {"error": str(exception)})
@@ -1,13 +1,33 @@
-from celery.signals import worker_init
-from app.core.config import settings
-from app.db.database import get_db
+import asyncio
+from celery.signals import worker_init, worker_process_init
+from sqlalchemy import text
+from app.core.config import Settings, settings
+from app.db.database import engine, connect_and_init_db
+from app.tasks import validation
 
 
 celery = settings.celery
 redis_client = settings.redis_client
-loop = settings.loop
+
+
+async def warm_up_db_pool():
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
 
 
 @worker_init.connect
 def on_worker_init(**kwargs):
-    loop.run_until_complete(get_db())
+    settings.loop.run_until_complete(connect_and_init_db())
+
+
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    # The parent's event loop shares its epoll instance and self-pipe with
+    # every child, so each child runs its own. The inherited loop is left
+    # unclosed: closing it would unregister the parent's self-pipe as well.
+    Settings.loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(settings.loop)
+    # Connections inherited from the parent must not be shared across the fork.
+    engine.sync_engine.dispose(close=False)
+    settings.loop.run_until_complete(warm_up_db_pool())
+    validation.warm_up()
@@ -1,5 +1,5 @@
 import fitz
-from helper import get_pdf_document, find_section_page, find_next_section_page, extract_section_content, check_assurance_number
+from helper import get_pdf_document, get_text_cache, extract_section_content, check_assurance_number
 
 # Store constants for animal and human subjects
 CONSTANTS = {
@@ -105,14 +105,11 @@ def validate_subject_involvement(section_text, pages_info, subject_type):
 def main():
     pdf_path = "../Docs/Application/Amalgent_Sept4_FT_Application_Submitted.pdf"
     section_title = "R&R Other Project Information"
-    doc = get_pdf_document(pdf_path)
+    doc = get_text_cache(get_pdf_document(pdf_path))
 
-    toc = doc.get_toc()
-    start_page = find_section_page(toc, section_title)
-    next_section_page = find_next_section_page(toc, section_title)
+    start_page, end_page = doc.section_index.section_range(section_title)
 
     if start_page is not None:
-        end_page = next_section_page - 1 if next_section_page is not None else len(doc)
         print(f"The '{section_title}' section starts on page {start_page} and ends on page {end_page}.")
 
         section_text, pages_info = extract_section_content(doc, section_title)
@@ -0,0 +1,57 @@
+import re
+from helper import get_pdf_document, get_text_cache
+
+FIGURE_PATTERN = re.compile(r"Figure\s+(\d+)\.\s")
+
+
+def check_figure_sequence_in_section(doc, start_page, end_page):
+    errors = []
+    cache = get_text_cache(doc)
+    last_figure_number = 0
+
+    for page_num, text in cache.get_pages_text(start_page - 1, end_page):
+        images = cache.get_page_text(page_num, "images")
+
+        if images:
+            # Only count figure captions after the last image on the page
+            text_after_last_image = text.split(images[-1])[-1]
+        else:
+            text_after_last_image = text
+
+        figures = FIGURE_PATTERN.findall(text_after_last_image)
+
+        for figure in figures:
+            figure_number = int(figure)
+            if figure_number != last_figure_number + 1:
+                errors.append(
+                    f"Figure number is out of sequence on page {page_num + 1} for figure {figure_number}."
+                )
+            last_figure_number = figure_number
+
+    return errors
+
+
+def main():
+    pdf_path = "../Docs/Application/EyeSonix_Application_Preview 1.pdf"
+    section_title = "Research strategy"
+    cache = get_text_cache(get_pdf_document(pdf_path))
+
+    start_page, end_page = cache.section_index.section_range(section_title)
+
+    if start_page is not None:
+        print(
+            f"The '{section_title}' section starts on page {start_page} and ends on page {end_page}."
+        )
+
+        errors = check_figure_sequence_in_section(cache, start_page, end_page)
+        if errors:
+            for error in errors:
+                print(error)
+        else:
+            print("All figures in the section are in correct sequence.")
+    else:
+        print(f"The '{section_title}' section was not found in the Table of Contents.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import fitz
-from helper import get_pdf_document, find_section_page, find_next_section_page
+from helper import get_pdf_document, get_text_cache
+from matcher import HeaderMatcher
 
 HEADERS = [
     "1. Description of Procedures",
@@ -8,19 +9,17 @@ HEADERS = [
     "4. Methods of Euthanasia",
 ]
 
+HEADER_MATCHER = HeaderMatcher(HEADERS)
+
 
 def check_vertebrate_animals_headers(doc, start_page, end_page):
     errors = []
     headers_found = {header: False for header in HEADERS}
+    cache = get_text_cache(doc)
 
-    for page_num in range(start_page - 1, end_page):
-        page = doc[page_num]
-        text = page.get_text("text")
-
-        for line in text.split("\n"):
-            for header in HEADERS:
-                if line.startswith(header):
-                    headers_found[header] = True
+    for _, text in cache.get_pages_text(start_page - 1, end_page):
+        for header, _ in HEADER_MATCHER.matched_patterns(text):
+            headers_found[header] = True
 
     for header, found in headers_found.items():
         if not found:
@@ -32,17 +31,15 @@ def check_vertebrate_animals_headers(doc, start_page, end_page):
 
 
 def validate_headers_in_section(doc, section_title):
-    toc = doc.get_toc()
-    start_page = find_section_page(toc, section_title)
-    next_section_page = find_next_section_page(toc, section_title)
+    cache = get_text_cache(doc)
+    start_page, end_page = cache.section_index.section_range(section_title)
 
     if start_page is not None:
-        end_page = next_section_page - 1 if next_section_page is not None else len(doc)
         print(
             f"The '{section_title}' section starts on page {start_page} and ends on page {end_page}.\n"
         )
 
-        errors = check_vertebrate_animals_headers(doc, start_page, end_page)
+        errors = check_vertebrate_animals_headers(cache, start_page, end_page)
         if errors:
             for error in errors:
                 print(error)
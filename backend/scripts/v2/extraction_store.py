@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "grant-engine", "extraction.sqlite3"
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    digest TEXT PRIMARY KEY,
+    page_count INTEGER NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_last_used ON documents (last_used);
+CREATE TABLE IF NOT EXISTS pages (
+    digest TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    page_num INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (digest, mode, page_num)
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    digest TEXT NOT NULL,
+    name TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (digest, name)
+);
+"""
+
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode(value):
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode(payload):
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+class ExtractionStore:
+    """SQLite cache of extraction results keyed by PDF digest and extraction mode.
+
+    Documents are evicted least-recently-used first once the stored payloads
+    exceed max_bytes.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def get_page_count(self, digest):
+        """Return the page count of a cached document and mark it as recently used."""
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT page_count FROM documents WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE documents SET last_used = ? WHERE digest = ?",
+                (time.time(), digest),
+            )
+        return row[0]
+
+    def get_pages(self, digest, mode):
+        """Return {page_num: content} for every cached page of a document in one mode."""
+        rows = self.connection.execute(
+            "SELECT page_num, payload FROM pages WHERE digest = ? AND mode = ?",
+            (digest, mode),
+        )
+        return {page_num: _decode(payload) for page_num, payload in rows}
+
+    def get_artifact(self, digest, name):
+        """Return a cached per-document value such as the TOC, or None."""
+        row = self.connection.execute(
+            "SELECT payload FROM artifacts WHERE digest = ? AND name = ?",
+            (digest, name),
+        ).fetchone()
+        return _decode(row[0]) if row else None
+
+    def put(self, digest, page_count, pages=None, artifacts=None):
+        """Store extracted pages ({(mode, page_num): content}) and artifacts for a document."""
+        page_rows = [
+            (digest, mode, page_num, _encode(content))
+            for (mode, page_num), content in (pages or {}).items()
+        ]
+        artifact_rows = [
+            (digest, name, _encode(value)) for name, value in (artifacts or {}).items()
+        ]
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO documents (digest, page_count, last_used) VALUES (?, ?, ?) "
+                "ON CONFLICT (digest) DO UPDATE SET last_used = excluded.last_used",
+                (digest, page_count, time.time()),
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", page_rows
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?)", artifact_rows
+            )
+            self.connection.execute(
+                "UPDATE documents SET size = "
+                "(SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM pages WHERE digest = ?) + "
+                "(SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM artifacts WHERE digest = ?) "
+                "WHERE digest = ?",
+                (digest, digest, digest),
+            )
+        self.evict()
+
+    def delete(self, digest):
+        with self.connection:
+            for table in ("pages", "artifacts", "documents"):
+                self.connection.execute(f"DELETE FROM {table} WHERE digest = ?", (digest,))
+
+    def evict(self):
+        """Drop least-recently-used documents until the store fits in max_bytes."""
+        (total,) = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM documents"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self.connection.execute(
+            "SELECT digest, size FROM documents ORDER BY last_used"
+        ).fetchall()
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.delete(digest)
+            total -= size
@@ -1,9 +1,328 @@
+import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import fitz
+from extraction_store import hash_file
+from section_index import SectionIndex
+from span_index import SpanIndex, spans_from_text_dict
+
+# Documents with fewer uncached pages than this are extracted serially,
+# since starting worker processes costs more than it saves.
+PARALLEL_PAGE_THRESHOLD = 64
+PARALLEL_MAX_WORKERS = os.cpu_count() or 1
+
+# Set once a process pool could not be started in this process (daemonic
+# processes such as Celery's prefork children cannot have children), so
+# later documents go straight to serial extraction instead of retrying.
+_parallel_unavailable = False
+
+# Image blocks carry raw bytes; the span walks never read them and leaving
+# them out keeps "dict" output JSON-serializable for the ExtractionStore.
+DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+def _extract_page(page, mode):
+    if mode == "images":
+        # Names of the images a page draws, in get_images order.
+        return [image[7] for image in page.get_images(full=True)]
+    if mode == "spans":
+        return spans_from_text_dict(page.get_text("dict", flags=DICT_FLAGS))
+    if mode in ("dict", "rawdict"):
+        return page.get_text(mode, flags=DICT_FLAGS)
+    return page.get_text(mode)
+
+
+def page_fingerprint(page):
+    """Return [text_hash, layout_hash] for a page without extracting its text.
+
+    The text hash covers the page's content streams and those of the Form
+    XObjects it draws (e.g. "/Fm0 Do", nested forms included), which
+    between them hold every text drawing operator; the layout hash covers
+    the page box, rotation and the fonts and images the page draws with.
+    """
+    text_hash = hashlib.sha1(page.read_contents())
+    for xref, name, _, _ in page.get_xobjects():
+        # By name and content, not xref, which differs between exports.
+        text_hash.update(name.encode("utf-8"))
+        text_hash.update(page.parent.xref_stream(xref) or b"")
+    text_hash = text_hash.hexdigest()
+    layout = (
+        tuple(page.rect),
+        page.rotation,
+        sorted((font[3], font[4]) for font in page.get_fonts()),
+        sorted((image[7], image[2], image[3]) for image in page.get_images()),
+    )
+    layout_hash = hashlib.sha1(repr(layout).encode("utf-8")).hexdigest()
+    return [text_hash, layout_hash]
+
+
+def configure_parallel_extraction(max_workers=None, page_threshold=None):
+    """Override the worker count and page threshold of parallel extraction.
+
+    A max_workers of 1 turns parallel extraction off.
+    """
+    global PARALLEL_MAX_WORKERS, PARALLEL_PAGE_THRESHOLD
+    if max_workers is not None:
+        PARALLEL_MAX_WORKERS = max(1, int(max_workers))
+    if page_threshold is not None:
+        PARALLEL_PAGE_THRESHOLD = int(page_threshold)
+
+
+def _extract_pages(file_path, page_numbers, mode):
+    """Worker: open the document separately and extract the given pages."""
+    with fitz.open(file_path) as doc:
+        return [_extract_page(doc.load_page(page_num), mode) for page_num in page_numbers]
+
+
+def extract_pages_parallel(file_path, page_numbers, mode="text", max_workers=None):
+    """Extract pages across a process pool and return {page_num: text} in page order."""
+    max_workers = max_workers or PARALLEL_MAX_WORKERS
+    page_numbers = sorted(page_numbers)
+    chunk_size = -(-len(page_numbers) // max_workers)
+    chunks = [
+        page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = executor.map(
+            _extract_pages,
+            [file_path] * len(chunks),
+            chunks,
+            [mode] * len(chunks),
+        )
+        pages = {}
+        for chunk, texts in zip(chunks, results):
+            pages.update(zip(chunk, texts))
+    return pages
+
+
+class DocumentTextCache:
+    """Per-document cache that extracts each page at most once per mode.
+
+    Besides PyMuPDF's get_text modes, the "spans" mode yields the compact
+    span columns behind span_index and the "images" mode the names of the
+    images each page draws.
+
+    With an ExtractionStore, a document whose digest is already stored is
+    served from disk and the PDF itself is only opened on a cache miss.
+    """
+
+    def __init__(
+        self,
+        doc=None,
+        file_path=None,
+        store=None,
+        max_workers=None,
+        parallel_threshold=None,
+    ):
+        self._doc = doc
+        self.file_path = file_path or (doc.name if doc is not None else None)
+        self.store = store
+        # None follows the module settings (see configure_parallel_extraction)
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self._pages = {}
+        self._toc = None
+        self._section_index = None
+        self._span_index = None
+        self._fingerprints = None
+        self._reused = None
+        self._page_count = None
+        self._loaded_modes = set()
+        self._unsaved = {}
+        # Optional callable notified with each zero-based page handed to a caller
+        self.page_listener = None
+
+        self.digest = None
+        if store is not None and self.file_path and os.path.isfile(self.file_path):
+            self.digest = hash_file(self.file_path)
+            self._page_count = store.get_page_count(self.digest)
+            if self._page_count is not None:
+                self._toc = store.get_artifact(self.digest, "toc")
+                section_index = store.get_artifact(self.digest, "section_index")
+                if section_index is not None:
+                    self._section_index = SectionIndex.from_dict(section_index)
+                self._fingerprints = store.get_artifact(self.digest, "fingerprints")
+
+    @property
+    def doc(self):
+        """The underlying fitz.Document, opened on first use."""
+        if self._doc is None:
+            self._doc = get_pdf_document(self.file_path)
+        return self._doc
+
+    def __len__(self):
+        if self._page_count is None:
+            self._page_count = len(self.doc)
+        return self._page_count
+
+    def get_toc(self):
+        """Return the table of contents, read from the document once."""
+        if self._toc is None:
+            self._toc = self.doc.get_toc()
+        return self._toc
+
+    @property
+    def section_index(self):
+        """The SectionIndex of the document, built from the TOC once."""
+        if self._section_index is None:
+            self._section_index = SectionIndex.from_toc(self.get_toc(), len(self))
+        return self._section_index
+
+    def get_fingerprints(self):
+        """Return the page_fingerprint of every page, computed once."""
+        if self._fingerprints is None:
+            self._fingerprints = [page_fingerprint(page) for page in self.doc]
+        return self._fingerprints
+
+    def reuse_pages(self, previous_digest, page_numbers):
+        """Serve the given zero-based pages from a stored earlier version of the document.
+
+        The caller vouches that those pages are unchanged (see get_fingerprints);
+        their stored extractions are copied instead of extracted again.
+        """
+        if self.store is not None:
+            self._reused = (previous_digest, set(page_numbers))
+            self._loaded_modes.clear()
+
+    @property
+    def span_index(self):
+        """The SpanIndex of the document for style queries."""
+        if self._span_index is None:
+            self._span_index = SpanIndex(self)
+        return self._span_index
+
+    def _load_mode(self, mode):
+        if mode in self._loaded_modes:
+            return
+        self._loaded_modes.add(mode)
+        if self.digest is not None:
+            for page_num, content in self.store.get_pages(self.digest, mode).items():
+                self._pages.setdefault((mode, page_num), content)
+        if self._reused is not None:
+            previous_digest, page_numbers = self._reused
+            for page_num, content in self.store.get_pages(previous_digest, mode).items():
+                if page_num in page_numbers and (mode, page_num) not in self._pages:
+                    self._set_page_text(page_num, mode, content)
+
+    def _set_page_text(self, page_num, mode, content):
+        self._pages[(mode, page_num)] = content
+        if self.digest is not None:
+            self._unsaved[(mode, page_num)] = content
+
+    def get_page_text(self, page_num, mode="text"):
+        """Return the extracted content of a zero-based page."""
+        self._load_mode(mode)
+        key = (mode, page_num)
+        if key not in self._pages:
+            self._set_page_text(page_num, mode, _extract_page(self.doc.load_page(page_num), mode))
+        if self.page_listener is not None:
+            self.page_listener(page_num)
+        return self._pages[key]
+
+    def prefetch(self, start_page, end_page, mode="text"):
+        """Extract the uncached pages in [start_page, end_page), in parallel when worthwhile."""
+        global _parallel_unavailable
+        self._load_mode(mode)
+        missing = [
+            page_num
+            for page_num in range(start_page, end_page)
+            if (mode, page_num) not in self._pages
+        ]
+        max_workers = self.max_workers or PARALLEL_MAX_WORKERS
+        threshold = self.parallel_threshold
+        if threshold is None:
+            threshold = PARALLEL_PAGE_THRESHOLD
+        if (
+            _parallel_unavailable
+            or len(missing) < threshold
+            or max_workers < 2
+            or not self.file_path
+            or not os.path.isfile(self.file_path)
+        ):
+            return
+
+        try:
+            pages = extract_pages_parallel(self.file_path, missing, mode, max_workers)
+        except (AssertionError, OSError, BrokenProcessPool):
+            # get_page_text falls back to serial extraction, here and for
+            # every later document of this process.
+            _parallel_unavailable = True
+            return
+        for page_num, text in pages.items():
+            self._set_page_text(page_num, mode, text)
+
+    def get_pages_text(self, start_page, end_page, mode="text"):
+        """Return (page_num, text) pairs for zero-based pages in [start_page, end_page)."""
+        self.prefetch(start_page, end_page, mode)
+        return [
+            (page_num, self.get_page_text(page_num, mode))
+            for page_num in range(start_page, end_page)
+        ]
+
+    def iter_pages(self, start_page=0, end_page=None, mode="text", retain=True):
+        """Lazily yield (page_num, text) for zero-based pages in [start_page, end_page).
+
+        Pages are extracted only as the caller advances, so a caller that
+        stops early never extracts the rest. With retain=False, pages that
+        were not already cached are not kept either.
+        """
+        self._load_mode(mode)
+        end_page = len(self) if end_page is None else end_page
+        for page_num in range(start_page, end_page):
+            content = self._pages.get((mode, page_num))
+            if content is None:
+                content = _extract_page(self.doc.load_page(page_num), mode)
+                if retain:
+                    self._set_page_text(page_num, mode, content)
+            if self.page_listener is not None:
+                self.page_listener(page_num)
+            yield page_num, content
+
+    def save(self):
+        """Write newly extracted pages and the TOC to the store."""
+        if self.digest is None:
+            return
+        artifacts = {
+            "toc": self.get_toc(),
+            "section_index": self.section_index.to_dict(),
+        }
+        if self._fingerprints is not None:
+            artifacts["fingerprints"] = self._fingerprints
+        self.store.put(self.digest, len(self), pages=self._unsaved, artifacts=artifacts)
+        self._unsaved = {}
+
+    def close(self):
+        """Persist to the store, if any, and close the document if it was opened."""
+        self.save()
+        if self._doc is not None:
+            self._doc.close()
+
 
 def get_pdf_document(file_path):
     """Open the PDF document."""
     return fitz.open(file_path)
 
+def get_text_cache(doc):
+    """Wrap a document in a DocumentTextCache unless it already is one."""
+    if isinstance(doc, DocumentTextCache):
+        return doc
+    return DocumentTextCache(doc)
+
+def open_document_cache(file_path, store=None, **kwargs):
+    """Create a DocumentTextCache for a PDF path, backed by an optional ExtractionStore."""
+    return DocumentTextCache(file_path=file_path, store=store, **kwargs)
+
+def iter_page_text(doc, start_page=0, end_page=None, mode="text"):
+    """Lazily yield (page_num, text) for zero-based pages of a document or cache.
+
+    A plain fitz.Document is streamed one page at a time without keeping
+    any text; a DocumentTextCache keeps what it extracts for later checks.
+    """
+    cache = get_text_cache(doc)
+    return cache.iter_pages(start_page, end_page, mode, retain=cache is doc)
+
 def extract_text_between_markers(text, start_marker, end_marker):
     """Extract text between two markers."""
     start_index = text.find(start_marker) + len(start_marker)
@@ -35,18 +354,13 @@ def find_next_section_page(toc, current_section_title):
 
 def extract_section_content(doc, section_title):
     """Extract text from the specified section."""
-    toc = doc.get_toc()
-    start_page = find_section_page(toc, section_title)
-    end_page = find_next_section_page(toc, section_title)
+    cache = get_text_cache(doc)
+    start_page, end_page = cache.section_index.section_range(section_title)
 
     if start_page is not None:
-        section_text = ""
-        pages_info = []
-        for page_num in range(start_page - 1, (end_page or len(doc)) - 1):
-            page = doc.load_page(page_num)
-            text = page.get_text("text")
-            section_text += text
-            pages_info.append((page_num + 1, text))
+        pages = cache.get_pages_text(start_page - 1, end_page)
+        section_text = "".join(text for _, text in pages)
+        pages_info = [(page_num + 1, text) for page_num, text in pages]
         return section_text, pages_info
     return None, []
 
@@ -57,8 +371,19 @@ def check_assurance_number(page_text, page_num, start_text, end_text):
         return f"False! Correct {start_text} required at page {page_num}."
     return None
 
+def extract_text_with_page_offsets(doc):
+    """Extract the text of the whole document and the offset at which each page starts."""
+    cache = get_text_cache(doc)
+    chunks = []
+    page_starts = []
+    offset = 0
+    for _, text in cache.get_pages_text(0, len(cache)):
+        page_starts.append(offset)
+        chunks.append(text + "\n")
+        offset += len(text) + 1
+    return "".join(chunks), page_starts
+
 def extract_text_from_doc(doc):
-    text = ""
-    for page in doc:
-        text += page.get_text("text") + "\n"
-    return text
\ No newline at end of file
+    """Extract the text of the whole document, one page per chunk."""
+    text, _ = extract_text_with_page_offsets(doc)
+    return text
@@ -0,0 +1,94 @@
+from collections import deque, namedtuple
+
+PREFIX = "prefix"
+EXACT = "exact"
+SUBSTRING = "substring"
+
+Match = namedtuple("Match", ["pattern", "mode", "start", "end"])
+
+
+class HeaderMatcher:
+    """Aho-Corasick matcher for a fixed set of headers and markers.
+
+    Patterns are registered as plain strings (using the default mode) or as
+    (pattern, mode) pairs, where mode is one of:
+
+    - PREFIX: the pattern starts a line (like line.startswith(pattern))
+    - EXACT: the pattern is the whole line, ignoring surrounding whitespace
+      (like line.strip() == pattern)
+    - SUBSTRING: the pattern occurs anywhere
+
+    The automaton is built once; each scan is a single pass over the text
+    regardless of how many patterns are registered.
+    """
+
+    def __init__(self, patterns, mode=PREFIX):
+        self.patterns = [
+            (pattern, mode) if isinstance(pattern, str) else tuple(pattern)
+            for pattern in patterns
+        ]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for pattern_id, (pattern, _) in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (pattern_id,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def finditer(self, text, start=0, end=None):
+        """Yield every Match in text[start:end], ordered by end offset."""
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        end = len(text) if end is None else end
+        state = 0
+        for index in range(start, end):
+            char = text[index]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                pattern, mode = patterns[pattern_id]
+                match_start = index + 1 - len(pattern)
+                if self._accepts(text, mode, match_start, index + 1, end):
+                    yield Match(pattern, mode, match_start, index + 1)
+
+    def find_all(self, text, start=0, end=None):
+        return list(self.finditer(text, start, end))
+
+    def matched_patterns(self, text, start=0, end=None):
+        """Return the set of (pattern, mode) pairs found in text."""
+        return {(match.pattern, match.mode) for match in self.finditer(text, start, end)}
+
+    @staticmethod
+    def _accepts(text, mode, match_start, match_end, end):
+        if mode == SUBSTRING:
+            return True
+        if mode == PREFIX:
+            return match_start == 0 or text[match_start - 1] == "\n"
+        line_start = text.rfind("\n", 0, match_start) + 1
+        line_end = text.find("\n", match_end, end)
+        if line_end == -1:
+            line_end = end
+        return (
+            not text[line_start:match_start].strip()
+            and not text[match_end:line_end].strip()
+        )
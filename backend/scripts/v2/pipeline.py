@@ -0,0 +1,379 @@
+import hashlib
+import importlib
+import json
+import re
+from extraction_store import ExtractionStore
+from helper import (
+    open_document_cache,
+    get_text_cache,
+    extract_section_content,
+)
+
+biohazards = importlib.import_module("R&R_BioHazards")
+narrative = importlib.import_module("R&R_Project_Narrative")
+summary = importlib.import_module("R&R_Summary")
+sbc_control_id = importlib.import_module("SBIR_STTR_Information_Validate_SBC_Control_ID")
+consortium = importlib.import_module("R&R_budget_Consortium_1")
+vertebrate_animals = importlib.import_module("Vertebrate_Animals_Headers")
+other_project_info = importlib.import_module("R&R_other_project_info")
+research_strategy_figures = importlib.import_module("Research_Strategy_Figures")
+
+# Validators outside the application pipeline whose rule patterns should
+# also be compiled by warm_up.
+VALIDATOR_MODULES = ["play_DMSP", "play_assignment"]
+
+CHECKS = []
+
+PAGE_PATTERN = re.compile(r"\bpages?\s*:?\s*(\d+)", re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r"\d+")
+
+
+def register_check(name, section_title):
+    """Register a check that runs against the pages of one TOC section."""
+    def decorator(func):
+        CHECKS.append({"name": name, "section": section_title, "func": func})
+        return func
+    return decorator
+
+
+class ValidationContext:
+    """A document opened once, with its TOC and section index built once.
+
+    progress, if given, is called as progress(stage, pages=n, rules=n) with
+    the number of newly read section pages or finished checks.
+    """
+
+    def __init__(self, doc, progress=None):
+        self.cache = get_text_cache(doc)
+        self.sections = self.cache.section_index
+        self.page_count = len(self.cache)
+        self.progress = progress
+        self.stage = None
+        self._tracked_pages = set()
+        self._pages_read = set()
+
+    def section_pages(self, section_title):
+        """Return the 1-based (start, end) pages of a section, or (None, None)."""
+        return self.sections.section_range(section_title)
+
+    def track_pages(self, checks):
+        """Report reads of the pages covered by the checks' sections as progress."""
+        self._tracked_pages = section_pages_for(self, checks)
+        if self.progress is not None:
+            self.cache.page_listener = self._on_page
+
+    def _on_page(self, page_num):
+        page_number = page_num + 1
+        if page_number in self._tracked_pages and page_number not in self._pages_read:
+            self._pages_read.add(page_number)
+            self.progress(self.stage, pages=1)
+
+    def skip_pages(self, check):
+        """Count a carried-over check's section pages as read."""
+        pages = section_pages_for(self, [check]) - self._pages_read
+        self._pages_read.update(pages)
+        return len(pages)
+
+
+def section_pages_for(context, checks):
+    """Return the set of 1-based pages covered by the sections of the checks."""
+    pages = set()
+    for check in checks:
+        start_page, end_page = context.section_pages(check["section"])
+        if start_page is not None:
+            pages.update(range(start_page, end_page + 1))
+    return pages
+
+
+def count_section_pages(doc, checks=None):
+    """Return how many section pages a run of the given checks reads."""
+    context = ValidationContext(doc)
+    return len(section_pages_for(context, CHECKS if checks is None else checks))
+
+
+@register_check("biohazards", "Facilities & Other Resources")
+def check_biohazards(context, start_page, end_page):
+    errors = []
+    for specific_text in biohazards.texts:
+        error = biohazards.extract_style(context.cache, start_page - 1, end_page, specific_text)
+        if error:
+            errors.append(error)
+    return errors
+
+
+@register_check("narrative", "PROJECT NARRATIVE")
+def check_narrative(context, start_page, end_page):
+    content = extract_section_content(context.cache, "PROJECT NARRATIVE")
+    error = narrative.count_narrative_length(content)
+    return [error] if error else []
+
+
+@register_check("summary", "PROJECT SUMMARY")
+def check_summary(context, start_page, end_page):
+    content = extract_section_content(context.cache, "PROJECT SUMMARY")
+    error = summary.count_summary_length(content)
+    return [error] if error else []
+
+
+@register_check("sbc_control_id", "SBIR STTR Information")
+def check_sbc_control_id(context, start_page, end_page):
+    error = sbc_control_id.validate_sbc_control_id(context.cache, start_page, end_page)
+    return [error] if error else []
+
+
+@register_check("consortium", "PHS Research Plan")
+def check_consortium(context, start_page, end_page):
+    if context.section_pages("Subaward Budget 1")[0] is None:
+        return []
+    result = consortium.check_consortium_doc(start_page - 1, end_page - 1, context.cache)
+    return [result] if result.startswith("Error") else []
+
+
+@register_check("vertebrate_animals_headers", "Vertebrate Animals")
+def check_vertebrate_animals_headers(context, start_page, end_page):
+    return vertebrate_animals.check_vertebrate_animals_headers(context.cache, start_page, end_page)
+
+
+@register_check("other_project_info", "R&R Other Project Information")
+def check_other_project_info(context, start_page, end_page):
+    section_text, pages_info = extract_section_content(context.cache, "R&R Other Project Information")
+    errors = []
+    for subject_type in ["animal", "human"]:
+        errors.extend(
+            other_project_info.validate_subject_involvement(section_text, pages_info, subject_type)
+        )
+    return errors
+
+
+@register_check("figure_sequence", "Research Strategy")
+def check_figure_sequence(context, start_page, end_page):
+    return research_strategy_figures.check_figure_sequence_in_section(context.cache, start_page, end_page)
+
+
+def warm_up():
+    """Import every validator so module-level patterns and matchers are compiled once."""
+    for module_name in VALIDATOR_MODULES:
+        importlib.import_module(module_name)
+
+
+def get_checks(names=None):
+    """Return the registered checks, optionally only those with the given names."""
+    if names is None:
+        return list(CHECKS)
+    return [check for check in CHECKS if check["name"] in names]
+
+
+def make_finding(check, message, severity="error"):
+    """Turn one validator message into a structured finding.
+
+    Validators report free-form strings, so the page is parsed from the
+    first "page N" in the message. The code is derived from the message with
+    its numbers blanked out, so the same problem gets the same code on every
+    page and every document.
+    """
+    page = PAGE_PATTERN.search(message)
+    template = NUMBER_PATTERN.sub("#", message)
+    digest = hashlib.sha1(template.encode("utf-8")).hexdigest()[:8]
+    return {
+        "rule": check["name"],
+        "section": check["section"],
+        "page": int(page.group(1)) if page else None,
+        "severity": severity,
+        "code": f"{check['name']}.{digest}",
+        "message": message,
+    }
+
+
+def interrupted_result(context, check):
+    """Report entry for a check that did not run because the run was cut short."""
+    start_page, end_page = context.section_pages(check["section"])
+    return {
+        "name": check["name"],
+        "section": check["section"],
+        "start_page": start_page,
+        "end_page": end_page,
+        "status": "interrupted",
+        "errors": [],
+        "findings": [],
+    }
+
+
+def run_check(context, check, stop_on=()):
+    """Run one registered check and return its report entry."""
+    start_page, end_page = context.section_pages(check["section"])
+    result = {
+        "name": check["name"],
+        "section": check["section"],
+        "start_page": start_page,
+        "end_page": end_page,
+        "status": "skipped",
+        "errors": [],
+        "findings": [],
+    }
+    if start_page is None:
+        return result
+
+    try:
+        errors = check["func"](context, start_page, end_page)
+    except stop_on:
+        raise
+    except Exception as e:
+        result["status"] = "error"
+        result["errors"] = [f"Check failed: {e}"]
+        result["findings"] = [make_finding(check, result["errors"][0], "critical")]
+        return result
+
+    result["status"] = "failed" if errors else "passed"
+    result["errors"] = errors
+    result["findings"] = [make_finding(check, error) for error in errors]
+    return result
+
+
+def result_artifact(ruleset, check_name):
+    return f"check:{ruleset}:{check_name}"
+
+
+def carry_over_results(cache, previous_digest, checks, ruleset):
+    """Return {check name: result} for checks whose pages did not change since a previous version.
+
+    The previous version must have the same TOC and stored results for the
+    same ruleset. Its unchanged pages are reused by the cache, so only the
+    changed pages are extracted again.
+    """
+    store = cache.store
+    if store is None or cache.digest is None or cache.digest == previous_digest:
+        return {}
+    previous_fingerprints = store.get_artifact(previous_digest, "fingerprints")
+    previous_toc = store.get_artifact(previous_digest, "toc")
+    if previous_fingerprints is None or previous_toc != [list(entry) for entry in cache.get_toc()]:
+        return {}
+
+    unchanged = {
+        page_num
+        for page_num, (previous, current) in enumerate(
+            zip(previous_fingerprints, cache.get_fingerprints())
+        )
+        if previous == current
+    }
+    cache.reuse_pages(previous_digest, unchanged)
+
+    carried = {}
+    for check in checks:
+        result = store.get_artifact(previous_digest, result_artifact(ruleset, check["name"]))
+        if result is None:
+            continue
+        start_page, end_page = cache.section_index.section_range(check["section"])
+        if start_page is None or all(
+            page_num in unchanged for page_num in range(start_page - 1, end_page)
+        ):
+            carried[check["name"]] = dict(result, carried_over=True)
+    return carried
+
+
+def run_pipeline(doc, checks=None, progress=None, carried=None, stop_on=()):
+    """Run the registered checks against one opened document.
+
+    Results in carried, keyed by check name, are reported instead of
+    running those checks again. An exception of a type in stop_on (such as
+    a time limit) ends the run early: the findings so far are kept, the
+    remaining checks are reported as interrupted and the report is partial.
+    """
+    context = ValidationContext(doc, progress)
+    checks = CHECKS if checks is None else checks
+    carried = carried or {}
+    context.track_pages([check for check in checks if check["name"] not in carried])
+    results = []
+    partial = False
+    try:
+        for check in checks:
+            context.stage = check["name"]
+            if check["name"] in carried:
+                results.append(carried[check["name"]])
+                if progress is not None:
+                    progress(check["name"], pages=context.skip_pages(check), rules=1)
+                continue
+            results.append(run_check(context, check, stop_on))
+            if progress is not None:
+                progress(check["name"], rules=1)
+    except stop_on:
+        partial = True
+        results.extend(
+            interrupted_result(context, check) for check in checks[len(results):]
+        )
+    finally:
+        context.cache.page_listener = None
+    return {
+        "page_count": context.page_count,
+        "passed": all(result["status"] in ("passed", "skipped") for result in results),
+        "partial": partial,
+        "checks": results,
+    }
+
+
+def merge_reports(reports):
+    """Combine reports from disjoint subsets of checks run on the same document."""
+    order = {check["name"]: i for i, check in enumerate(CHECKS)}
+    results = sorted(
+        (result for report in reports for result in report["checks"]),
+        key=lambda result: order.get(result["name"], len(order)),
+    )
+    return {
+        "document": reports[0]["document"],
+        "page_count": reports[0]["page_count"],
+        "passed": all(report["passed"] for report in reports),
+        "partial": any(report.get("partial") for report in reports),
+        "checks": results,
+    }
+
+
+def validate_application(
+    pdf_path,
+    checks=None,
+    store=None,
+    progress=None,
+    ruleset=None,
+    previous_digest=None,
+    stop_on=(),
+):
+    """Open an application once and run every registered check against it.
+
+    With an ExtractionStore, a previously processed PDF is served from the
+    store without being re-parsed. Given a ruleset version, check results
+    are stored too, and a new version of an application (previous_digest)
+    re-runs only the checks whose section pages changed.
+    """
+    cache = open_document_cache(pdf_path, store=store)
+    try:
+        checks = CHECKS if checks is None else checks
+        carried = {}
+        if previous_digest is not None and ruleset is not None:
+            carried = carry_over_results(cache, previous_digest, checks, ruleset)
+        report = run_pipeline(cache, checks, progress, carried, stop_on)
+        if ruleset is not None and cache.digest is not None:
+            store.put(
+                cache.digest,
+                len(cache),
+                artifacts={
+                    result_artifact(ruleset, result["name"]): {
+                        key: value for key, value in result.items() if key != "carried_over"
+                    }
+                    for result in report["checks"]
+                    if result["status"] != "interrupted"
+                },
+            )
+    finally:
+        cache.close()
+    report["document"] = pdf_path
+    return report
+
+
+def main():
+    pdf_path = "../Docs/Application/EyeSonix_Application_Preview 1.pdf"
+    store = ExtractionStore()
+    report = validate_application(pdf_path, store=store)
+    store.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
+import re
 import fitz
-from helper import get_pdf_document
+from helper import (
+    get_pdf_document,
+    get_text_cache,
+    extract_text_from_doc,
+    extract_text_with_page_offsets,
+)
+from matcher import HeaderMatcher, PREFIX, EXACT
+from segmenter import segment_elements
 
 ELEMENTS = [
     "Element 1: Data Type",
@@ -19,12 +27,11 @@ CONDITIONS = {
     "Element 6:": "Error: Element A found",
 }
 
-
-def extract_text_from_doc(doc):
-    text = ""
-    for page in doc:
-        text += page.get_text("text") + "\n"
-    return text
+ELEMENT_MATCHER = HeaderMatcher(
+    [(element, PREFIX) for element in ELEMENTS] + [(element, EXACT) for element in ELEMENTS]
+)
+OTHER_ELEMENT_PATTERN = re.compile(r"^element", re.IGNORECASE | re.MULTILINE)
+SUB_ELEMENT_PATTERN = re.compile(r"^([ABC])\.", re.MULTILINE)
 
 
 def check_elements(doc, exact_match=False):
@@ -32,20 +39,21 @@ def check_elements(doc, exact_match=False):
     found_elements = set()
     text = extract_text_from_doc(doc)
     element_count = {element: 0 for element in ELEMENTS}
-    other_elements_found = False
-
-    for line in text.split("\n"):
-        for element in element_set:
-            if (exact_match and line.strip() == element) or (
-                not exact_match and line.startswith(element)
-            ):
-                found_elements.add(element)
-                element_count[element] += 1
-
-        if line.lower().startswith("element") and not any(
-            line.startswith(element) for element in element_set
-        ):
-            other_elements_found = True
+    element_mode = EXACT if exact_match else PREFIX
+    element_line_starts = set()
+
+    for match in ELEMENT_MATCHER.finditer(text):
+        if match.mode == PREFIX:
+            element_line_starts.add(match.start)
+        if match.mode == element_mode:
+            found_elements.add(match.pattern)
+            element_count[match.pattern] += 1
+
+    # Lines starting with "element" that are not one of the known elements
+    other_elements_found = any(
+        match.start() not in element_line_starts
+        for match in OTHER_ELEMENT_PATTERN.finditer(text)
+    )
 
     missing_elements = list(element_set - found_elements)
     duplicate_elements = [element for element, count in element_count.items() if count > 1]
@@ -64,42 +72,24 @@ def check_elements(doc, exact_match=False):
 
 
 def find_sub_elements(doc):
-    sub_elements = []
-    element_set = set(ELEMENTS)
-    text = extract_text_from_doc(doc)
+    text, page_starts = extract_text_with_page_offsets(doc)
+    return text, segment_elements(text, ELEMENT_MATCHER, page_starts)
+
 
-    for line in text.split("\n"):
-        for element in element_set:
-            if line.startswith(element):
-                start = text.find(line)
-                end = len(text)
-                for next_element in element_set:
-                    next_start = text.find(next_element, start + 1)
-                    if next_start != -1 and next_start < end:
-                        end = next_start
-                sub_element = text[start:end]
-                sub_elements.append(sub_element)
-    return sub_elements
-
-
-def check_conditions_on_sub_elements(sub_elements):
+def check_conditions_on_sub_elements(text, sub_elements):
     errors = []
 
     for sub_element in sub_elements:
-        element_number = sub_element.split(":")[0]
+        element_number = sub_element.element.split(":")[0]
         found = {"A": False, "B": False, "C": False}
 
         for element, message in CONDITIONS.items():
-            if sub_element.startswith(element):
-                sub_lines = sub_element.split("\n")
-                found.update(
-                    {
-                        key: any(
-                            sub_line.startswith(f"{key}.") for sub_line in sub_lines
-                        )
-                        for key in found
-                    }
-                )
+            if sub_element.element.startswith(element):
+                # Scan the segment in place rather than slicing and splitting it
+                for match in SUB_ELEMENT_PATTERN.finditer(
+                    text, sub_element.start, sub_element.end
+                ):
+                    found[match.group(1)] = True
 
                 if element in ["Element 1:", "Element 4:", "Element 5:"]:
                     errors.extend(
@@ -118,12 +108,13 @@ def check_conditions_on_sub_elements(sub_elements):
 
 
 def validate_DMSP(doc):
+    cache = get_text_cache(doc)
     errors = []
-    element_errors = check_elements(doc, exact_match=False)
+    element_errors = check_elements(cache, exact_match=False)
     if element_errors != "All elements are present":
         errors.extend(element_errors)
-    sub_elements = find_sub_elements(doc)
-    sub_element_errors = check_conditions_on_sub_elements(sub_elements)
+    text, sub_elements = find_sub_elements(cache)
+    sub_element_errors = check_conditions_on_sub_elements(text, sub_elements)
     errors.extend(sub_element_errors)
     if not errors:
         errors.append("No errors found")
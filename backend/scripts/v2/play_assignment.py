@@ -1,10 +1,15 @@
 import fitz
-from helper import extract_text_between_markers, count_non_empty_entries, get_pdf_document
+from helper import (
+    extract_text_between_markers,
+    count_non_empty_entries,
+    get_pdf_document,
+    get_text_cache,
+)
 
 def extract_awarding_components(doc):
+    cache = get_text_cache(doc)
     count_awards = 0
-    for page in doc:
-        text = page.get_text("text")
+    for _, text in cache.get_pages_text(0, len(cache)):
         awarding_components_text = extract_text_between_markers(
             text,
             "Suggested Awarding Components:",
@@ -17,9 +22,9 @@ def extract_awarding_components(doc):
     return count_awards
 
 def extract_study_sections(doc):
+    cache = get_text_cache(doc)
     count_sections = 0
-    for page in doc:
-        text = page.get_text("text")
+    for _, text in cache.get_pages_text(0, len(cache)):
         study_sections_text = extract_text_between_markers(
             text,
             "Suggested Study Sections:",
@@ -36,8 +41,9 @@ def extract_study_sections(doc):
     return count_sections
 
 def validate_DMSP(doc):
-    count_awards = extract_awarding_components(doc)
-    count_study_sections = extract_study_sections(doc)
+    cache = get_text_cache(doc)
+    count_awards = extract_awarding_components(cache)
+    count_study_sections = extract_study_sections(cache)
     errors = []
 
     if count_awards < 2:
@@ -0,0 +1,85 @@
+import bisect
+from collections import namedtuple
+
+Section = namedtuple("Section", ["level", "title", "start_page", "end_page"])
+
+
+class SectionIndex:
+    """Page ranges of every TOC entry, built once per document.
+
+    A section ends on the page before the next entry at the same or a
+    shallower level, so a parent section spans its children. Pages are
+    1-based, as in get_toc().
+    """
+
+    def __init__(self, sections, page_count):
+        self.sections = sections
+        self.page_count = page_count
+        self._keys = [section.title.casefold() for section in sections]
+        self._lookups = {}
+
+        # Sections ordered by start page, for bisecting page -> section.
+        self._by_start = sorted(
+            range(len(sections)), key=lambda i: (sections[i].start_page, i)
+        )
+        self._starts = [sections[i].start_page for i in self._by_start]
+
+    @classmethod
+    def from_toc(cls, toc, page_count):
+        entries = [
+            (level, title, page_number)
+            for level, title, page_number, *_ in toc
+            if page_number >= 1
+        ]
+        sections = []
+        for i, (level, title, start_page) in enumerate(entries):
+            end_page = page_count
+            for next_level, _, next_page in entries[i + 1:]:
+                if next_level <= level:
+                    end_page = max(start_page, next_page - 1)
+                    break
+            sections.append(Section(level, title, start_page, end_page))
+        return cls(sections, page_count)
+
+    def find(self, section_title):
+        """Return the first section whose title contains section_title (case-insensitive)."""
+        key = section_title.casefold()
+        if key not in self._lookups:
+            self._lookups[key] = next(
+                (
+                    section
+                    for section, title in zip(self.sections, self._keys)
+                    if key in title
+                ),
+                None,
+            )
+        return self._lookups[key]
+
+    def section_range(self, section_title):
+        """Return the (start_page, end_page) of a section, or (None, None)."""
+        section = self.find(section_title)
+        if section is None:
+            return None, None
+        return section.start_page, section.end_page
+
+    def section_for_page(self, page_number):
+        """Return the deepest section containing a 1-based page, or None."""
+        position = bisect.bisect_right(self._starts, page_number) - 1
+        if position < 0:
+            return None
+        section = self.sections[self._by_start[position]]
+        if section.end_page < page_number:
+            return None
+        return section
+
+    def to_dict(self):
+        return {
+            "page_count": self.page_count,
+            "sections": [list(section) for section in self.sections],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            [Section(*section) for section in data["sections"]], data["page_count"]
+        )
@@ -0,0 +1,33 @@
+from collections import namedtuple
+from matcher import PREFIX
+
+Segment = namedtuple("Segment", ["element", "start", "end", "page"])
+
+
+def segment_elements(text, matcher, page_starts=None, mode=PREFIX):
+    """Split text into element spans in one pass over the matcher's header matches.
+
+    Each segment runs from its header to the next header (or the end of the
+    text). page_starts holds the offset at which each page begins in text,
+    as returned by extract_text_with_page_offsets; segments then carry the
+    1-based page their header is on.
+    """
+    page_starts = page_starts or [0]
+    page_index = 0
+    segments = []
+
+    for match in matcher.finditer(text):
+        if match.mode != mode:
+            continue
+        if segments and segments[-1].start == match.start:
+            # Several patterns prefix the same line; keep the longest.
+            if len(match.pattern) > len(segments[-1].element):
+                segments[-1] = segments[-1]._replace(element=match.pattern)
+            continue
+        while page_index + 1 < len(page_starts) and page_starts[page_index + 1] <= match.start:
+            page_index += 1
+        if segments:
+            segments[-1] = segments[-1]._replace(end=match.start)
+        segments.append(Segment(match.pattern, match.start, len(text), page_index + 1))
+
+    return segments
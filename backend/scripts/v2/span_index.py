@@ -0,0 +1,94 @@
+from array import array
+
+# Span flag bit PyMuPDF sets for bold fonts (fitz.TEXT_FONT_BOLD).
+TEXT_FONT_BOLD = 16
+
+
+def spans_from_text_dict(text_dict):
+    """Flatten a page's get_text("dict") output into compact span columns."""
+    columns = {"text": [], "font": [], "size": [], "flags": [], "color": [], "bbox": []}
+    for block in text_dict.get("blocks", []):
+        for line in block.get("lines", []):
+            for span in line.get("spans", []):
+                columns["text"].append(span.get("text", ""))
+                columns["font"].append(span.get("font", ""))
+                columns["size"].append(span.get("size", 0.0))
+                columns["flags"].append(span.get("flags", 0))
+                columns["color"].append(span.get("color", 0))
+                columns["bbox"].extend(span.get("bbox", (0.0, 0.0, 0.0, 0.0)))
+    return columns
+
+
+class PageSpans:
+    """The text spans of one page stored as parallel arrays."""
+
+    __slots__ = ("texts", "fonts", "sizes", "flags", "colors", "bboxes")
+
+    def __init__(self, columns):
+        self.texts = columns["text"]
+        self.fonts = columns["font"]
+        self.sizes = array("d", columns["size"])
+        self.flags = array("l", columns["flags"])
+        self.colors = array("l", columns["color"])
+        self.bboxes = array("d", columns["bbox"])
+
+    def __len__(self):
+        return len(self.texts)
+
+    def bbox(self, index):
+        return tuple(self.bboxes[index * 4:index * 4 + 4])
+
+    def span(self, index):
+        """Return one span as a dict shaped like get_text("dict") spans."""
+        return {
+            "text": self.texts[index],
+            "font": self.fonts[index],
+            "size": self.sizes[index],
+            "flags": self.flags[index],
+            "color": self.colors[index],
+            "bbox": self.bbox(index),
+        }
+
+    def find(self, specific_text, font_contains=None, bold=None):
+        """Yield indexes of spans containing specific_text that match the style filters."""
+        for index, text in enumerate(self.texts):
+            if specific_text not in text:
+                continue
+            if font_contains is not None and font_contains not in self.fonts[index]:
+                continue
+            if bold is not None and bool(self.flags[index] & TEXT_FONT_BOLD) != bold:
+                continue
+            yield index
+
+
+class SpanIndex:
+    """Style queries over a document's spans, each page extracted once.
+
+    Spans come from the DocumentTextCache "spans" mode, so they share its
+    parallel prefetch and ExtractionStore persistence.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._pages = {}
+
+    def page(self, page_num):
+        """Return the PageSpans of a zero-based page."""
+        if page_num not in self._pages:
+            self._pages[page_num] = PageSpans(self.cache.get_page_text(page_num, "spans"))
+        return self._pages[page_num]
+
+    def find_spans(self, specific_text, start_page, end_page, font_contains=None, bold=None):
+        """Yield (page_num, span) for matching spans in zero-based pages [start_page, end_page)."""
+        self.cache.prefetch(start_page, end_page, "spans")
+        for page_num in range(start_page, end_page):
+            page_spans = self.page(page_num)
+            for index in page_spans.find(specific_text, font_contains, bold):
+                yield page_num, page_spans.span(index)
+
+    def find_first(self, specific_text, start_page, end_page, font_contains=None, bold=None):
+        """Return the first matching (page_num, span), or None."""
+        return next(
+            self.find_spans(specific_text, start_page, end_page, font_contains, bold),
+            None,
+        )
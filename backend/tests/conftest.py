@@ -1,8 +1,11 @@
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import text
 from app.main import app
 from app.core.config import settings
-from app.db.database import connect_and_init_db
+from app.core.token_cache import token_cache
+from app.core.user_cache import user_cache
+from app.db.database import Base, connect_and_init_db, engine
 from app.models.user import User
 from app.services.user import UserService
 
@@ -23,8 +26,23 @@ async def override_dependency():
 
     app.dependency_overrides[connect_and_init_db] = mock_connect_and_init_db
 
+    # The test client does not run the lifespan that creates the schema.
+    await connect_and_init_db()
+
+    # Every test starts from empty tables, Redis keys and caches.
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    settings.redis_client.flushdb()
+    user_cache.clear()
+    token_cache.clear()
+
     yield
 
+    # Pooled connections are bound to this test's event loop.
+    await user_cache.close()
+    await engine.dispose()
+
 
 @pytest_asyncio.fixture(scope="function")
 async def async_client():
@@ -42,12 +60,28 @@ async def test_user(async_client: AsyncClient):
         "password": "String@123",
     }
     response = await async_client.post("/api/v1/user/signup", json=user_data)
-    assert response.status_code == 200
+    assert response.status_code == 201
     new_user = response.json()
     new_user["password"] = user_data["password"]
     return new_user
 
 
+@pytest_asyncio.fixture(scope="function")
+async def other_user_headers(async_client: AsyncClient):
+    """Authorization headers of a second, unrelated user."""
+    user_data = {
+        "email": "other@example.com",
+        "username": "other",
+        "first_name": "other",
+        "last_name": "other",
+        "password": "String@123",
+    }
+    response = await async_client.post("/api/v1/user/signup", json=user_data)
+    assert response.status_code == 201
+    token = UserService.create_access_token(response.json()["id"], expires_delta=None)
+    return {"Authorization": f"Bearer {token['encoded_jwt']}"}
+
+
 @pytest_asyncio.fixture(scope="function")
 async def token(test_user):
     token = UserService.create_access_token(test_user["id"], expires_delta=None)
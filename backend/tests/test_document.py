@@ -0,0 +1,140 @@
+import pytest
+from pathlib import Path
+from httpx import AsyncClient
+from app.core.config import settings
+
+SAMPLE_PDF = Path(__file__).resolve().parents[1] / "scripts" / "TestDocuments" / "DMSP3.pdf"
+
+
+class FakeAsyncResult:
+    def __init__(self, task_id):
+        self.id = task_id
+
+
+class PartialAsyncResult:
+    state = "SUCCESS"
+    result = {"passed": True, "partial": True}
+
+    def __init__(self, task_id, app=None):
+        self.id = task_id
+
+
+@pytest.fixture(autouse=True)
+def fake_send_task(monkeypatch):
+    monkeypatch.setattr(
+        settings.celery,
+        "send_task",
+        lambda *args, **kwargs: FakeAsyncResult(kwargs["task_id"]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_upload_document(authorized_client: AsyncClient):
+    response = await authorized_client.post(
+        "/api/v1/document/upload?filename=DMSP3.pdf",
+        content=SAMPLE_PDF.read_bytes(),
+        headers={"Content-Type": "application/pdf"},
+    )
+    assert response.status_code == 201
+    assert response.json()["task_id"]
+    assert response.json()["page_count"] == 2
+    assert len(response.json()["document_hash"]) == 64
+
+
+@pytest.mark.asyncio
+async def test_upload_invalid_document(authorized_client: AsyncClient):
+    response = await authorized_client.post(
+        "/api/v1/document/upload", content=b"not a pdf"
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_upload_document_too_large(authorized_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 1024)
+    response = await authorized_client.post(
+        "/api/v1/document/upload", content=SAMPLE_PDF.read_bytes()
+    )
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_upload_document_unauthorized(async_client: AsyncClient):
+    response = await async_client.post(
+        "/api/v1/document/upload", content=SAMPLE_PDF.read_bytes()
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_batch_submit(authorized_client: AsyncClient):
+    response = await authorized_client.post(
+        "/api/v1/document/batch",
+        files=[
+            ("files", ("DMSP3.pdf", SAMPLE_PDF.read_bytes(), "application/pdf")),
+            ("files", ("copy.pdf", SAMPLE_PDF.read_bytes(), "application/pdf")),
+        ],
+    )
+    assert response.status_code == 201
+    assert response.json()["batch_id"]
+    first, second = response.json()["items"]
+    assert second["deduplicated"] is True
+    assert second["task_id"] == first["task_id"]
+
+
+@pytest.mark.asyncio
+async def test_submissions_are_deduplicated_per_user(
+    authorized_client: AsyncClient, async_client: AsyncClient, other_user_headers
+):
+    first = await authorized_client.post(
+        "/api/v1/document/upload", content=SAMPLE_PDF.read_bytes()
+    )
+    second = await async_client.post(
+        "/api/v1/document/upload",
+        content=SAMPLE_PDF.read_bytes(),
+        headers=other_user_headers,
+    )
+    repeat = await async_client.post(
+        "/api/v1/document/upload",
+        content=SAMPLE_PDF.read_bytes(),
+        headers=other_user_headers,
+    )
+    assert first.status_code == second.status_code == repeat.status_code == 201
+    assert second.json()["task_id"] != first.json()["task_id"]
+    assert repeat.json()["deduplicated"] is True
+    assert repeat.json()["task_id"] == second.json()["task_id"]
+
+
+@pytest.mark.asyncio
+async def test_partial_result_is_not_reused(authorized_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr("app.services.document.AsyncResult", PartialAsyncResult)
+
+    first = await authorized_client.post(
+        "/api/v1/document/upload", content=SAMPLE_PDF.read_bytes()
+    )
+    second = await authorized_client.post(
+        "/api/v1/document/upload", content=SAMPLE_PDF.read_bytes()
+    )
+    assert second.status_code == 201
+    assert second.json()["deduplicated"] is False
+    assert second.json()["task_id"] != first.json()["task_id"]
+
+
+@pytest.mark.asyncio
+async def test_batch_submit_invalid_hash(authorized_client: AsyncClient):
+    response = await authorized_client.post(
+        "/api/v1/document/batch", data={"document_hashes": ["../../etc/passwd"]}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_tasks_status(authorized_client: AsyncClient):
+    settings.celery.backend.store_result("done", {"passed": True}, "SUCCESS")
+
+    response = await authorized_client.post(
+        "/api/v1/document/tasks_status", json={"task_ids": ["done", "queued"]}
+    )
+    assert response.status_code == 200
+    assert response.json()["counts"] == {"SUCCESS": 1, "PENDING": 1}
+    assert response.json()["items"][0]["passed"] is True
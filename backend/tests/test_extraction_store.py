@@ -0,0 +1,46 @@
+import os
+import sys
+from app.core.config import settings
+
+if settings.VALIDATORS_DIR not in sys.path:
+    sys.path.append(settings.VALIDATORS_DIR)
+
+from extraction_store import ExtractionStore  # noqa: E402
+from app.tasks import validation  # noqa: E402
+
+
+def random_page():
+    """Page text that zlib cannot shrink, so every document has about the same size."""
+    return os.urandom(2048).hex()
+
+
+def stored_digests(store):
+    return {digest for (digest,) in store.connection.execute("SELECT digest FROM documents")}
+
+
+def test_least_recently_used_document_is_evicted_past_max_bytes(tmp_path):
+    store = ExtractionStore(str(tmp_path / "store.sqlite3"))
+    store.put("first", 1, pages={("text", 0): random_page()})
+    (size,) = store.connection.execute("SELECT size FROM documents").fetchone()
+    store.max_bytes = int(size * 2.5)
+    store.put("second", 1, pages={("text", 0): random_page()})
+
+    # Reading the first document makes the second the least recently used.
+    assert store.get_page_count("first") == 1
+    store.put("third", 1, pages={("text", 0): random_page()})
+
+    assert stored_digests(store) == {"first", "third"}
+    assert store.get_pages("second", "text") == {}
+    assert store.get_page_count("second") is None
+    store.close()
+
+
+def test_worker_store_is_limited_by_the_setting(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_STORE_PATH", str(tmp_path / "store.sqlite3"))
+    monkeypatch.setattr(settings, "EXTRACTION_STORE_MAX_BYTES", "4096")
+    monkeypatch.setattr(validation, "extraction_store", None)
+
+    store = validation.get_extraction_store()
+
+    assert store.max_bytes == 4096
+    store.close()
@@ -0,0 +1,47 @@
+import sys
+from app.core.config import settings
+
+if settings.VALIDATORS_DIR not in sys.path:
+    sys.path.append(settings.VALIDATORS_DIR)
+
+from matcher import EXACT, PREFIX, SUBSTRING, HeaderMatcher, Match  # noqa: E402
+
+TEXT = "Data Type\nThe Data Type used\n  Related Tools  \nsee Related Tools here\n"
+
+
+def test_prefix_matches_only_at_line_start():
+    matcher = HeaderMatcher(["Data Type"])
+
+    assert matcher.find_all(TEXT) == [Match("Data Type", PREFIX, 0, 9)]
+
+
+def test_exact_matches_whole_line_ignoring_surrounding_whitespace():
+    matcher = HeaderMatcher([("Related Tools", EXACT), ("Data", EXACT)])
+
+    assert matcher.find_all(TEXT) == [Match("Related Tools", EXACT, 31, 44)]
+
+
+def test_substring_matches_anywhere():
+    matcher = HeaderMatcher(["Data Type"], mode=SUBSTRING)
+
+    assert [match.start for match in matcher.finditer(TEXT)] == [0, 14]
+
+
+def test_overlapping_patterns_are_all_reported():
+    matcher = HeaderMatcher(["Data", "Data Type", ("Type", SUBSTRING)])
+
+    assert matcher.find_all("Data Type") == [
+        Match("Data", PREFIX, 0, 4),
+        Match("Data Type", PREFIX, 0, 9),
+        Match("Type", SUBSTRING, 5, 9),
+    ]
+
+
+def test_matched_patterns_respects_scan_bounds():
+    matcher = HeaderMatcher([("Related Tools", EXACT), ("Data Type", SUBSTRING)])
+
+    assert matcher.matched_patterns(TEXT, start=10, end=48) == {
+        ("Data Type", SUBSTRING),
+        ("Related Tools", EXACT),
+    }
+    assert matcher.matched_patterns(TEXT, start=48) == set()
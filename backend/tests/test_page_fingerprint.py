@@ -0,0 +1,25 @@
+import sys
+import fitz
+from app.core.config import settings
+
+if settings.VALIDATORS_DIR not in sys.path:
+    sys.path.append(settings.VALIDATORS_DIR)
+
+from helper import page_fingerprint  # noqa: E402
+
+
+def page_drawing_form(text):
+    """Return a page whose only content is a Form XObject that draws text."""
+    source = fitz.open()
+    source.new_page().insert_text((72, 72), text)
+    doc = fitz.open()
+    page = doc.new_page()
+    page.show_pdf_page(page.rect, source, 0)
+    return page
+
+
+def test_fingerprint_covers_form_xobject_text():
+    aims = page_fingerprint(page_drawing_form("Specific Aims"))
+
+    assert page_fingerprint(page_drawing_form("Specific Aims")) == aims
+    assert page_fingerprint(page_drawing_form("Research Aims"))[0] != aims[0]
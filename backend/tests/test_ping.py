@@ -5,5 +5,38 @@ from httpx import AsyncClient
 @pytest.mark.asyncio
 async def test_ping(async_client: AsyncClient):
     response = await async_client.get("/ping")
-    assert response.json() == "Pong!"
+    assert response.json() == {"message": "pong!"}
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_db_pool_metrics(authorized_client: AsyncClient):
+    response = await authorized_client.get("/db_pool_metrics")
+    assert response.status_code == 200
+    assert {"checked_out", "idle", "overflow", "wait"} <= response.json().keys()
+    assert {"mean_wait_ms", "mean_connect_ms"} <= response.json()["wait"].keys()
+    checkouts = response.json()["wait"]["checkouts"]
+
+    response = await authorized_client.get("/api/v1/user/users")
+    assert response.status_code == 200
+    response = await authorized_client.get("/db_pool_metrics")
+    assert response.json()["wait"]["checkouts"] > checkouts
+
+
+@pytest.mark.asyncio
+async def test_db_pool_metrics_unauthorized(async_client: AsyncClient):
+    response = await async_client.get("/db_pool_metrics")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_metrics(authorized_client: AsyncClient):
+    response = await authorized_client.get("/password_hasher_metrics")
+    assert response.status_code == 200
+    assert {"running", "queue_depth", "rejected"} <= response.json().keys()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_metrics_unauthorized(async_client: AsyncClient):
+    response = await async_client.get("/password_hasher_metrics")
+    assert response.status_code == 401
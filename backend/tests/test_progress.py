@@ -0,0 +1,77 @@
+import json
+from app.core.config import settings
+from app.tasks.progress import ProgressPublisher, progress_channel
+from app.tasks.validation import (
+    merge_validation_reports,
+    publish_task_failure,
+    validate_document,
+    validate_section,
+)
+
+
+class CountingRedis:
+    """Real Redis client that counts rate gate attempts."""
+
+    def __init__(self, client):
+        self.client = client
+        self.gate_checks = 0
+
+    def set(self, *args, **kwargs):
+        self.gate_checks += 1
+        return self.client.set(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+def published_statuses(pubsub):
+    statuses = []
+    while (message := pubsub.get_message(timeout=0.1)) is not None:
+        if message["type"] == "message":
+            statuses.append(json.loads(message["data"])["status"])
+    return statuses
+
+
+def test_local_timer_skips_the_redis_gate_within_the_interval():
+    redis = CountingRedis(settings.redis_client)
+    progress = ProgressPublisher("throttled", redis_client=redis, max_rate=0.1)
+    progress.start(pages_total=10, rules_total=2)
+
+    for _ in range(5):
+        progress("text", pages=1)
+
+    assert redis.gate_checks == 1
+    assert progress.flush()["pages_done"] == 5
+
+
+def test_redis_gate_is_shared_by_publishers_of_one_task():
+    pubsub = settings.redis_client.pubsub()
+    pubsub.subscribe(progress_channel("shared"))
+    first = ProgressPublisher("shared", max_rate=0.1)
+    second = ProgressPublisher("shared", max_rate=0.1)
+    first.start(pages_total=10, rules_total=2)
+
+    first("text", pages=1)
+    second("text", pages=1)
+
+    # Only the first job won the gate; the second keeps its page buffered.
+    assert published_statuses(pubsub) == ["PROGRESS", "PROGRESS"]
+    assert second.flush()["pages_done"] == 2
+    pubsub.close()
+
+
+def test_failure_signal_publishes_only_for_tasks_outside_the_chord():
+    pubsub = settings.redis_client.pubsub()
+    pubsub.subscribe(progress_channel("root"))
+
+    for task in (validate_section, merge_validation_reports):
+        publish_task_failure(
+            sender=task, task_id="root", exception=RuntimeError("boom")
+        )
+    assert published_statuses(pubsub) == []
+
+    publish_task_failure(
+        sender=validate_document, task_id="root", exception=RuntimeError("boom")
+    )
+    assert published_statuses(pubsub) == ["FAILURE"]
+    pubsub.close()
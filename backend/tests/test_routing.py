@@ -0,0 +1,78 @@
+import os
+import subprocess
+from pathlib import Path
+import pytest
+from app.core.config import settings
+from app.tasks.routing import route_for_document, time_limits_for_document
+
+WORKER_START = Path(__file__).resolve().parents[1] / "worker-start.sh"
+
+
+@pytest.fixture
+def thresholds(monkeypatch):
+    monkeypatch.setattr(settings, "SMALL_DOCUMENT_MAX_PAGES", "25")
+    monkeypatch.setattr(settings, "SMALL_DOCUMENT_MAX_BYTES", "1000")
+
+
+@pytest.mark.parametrize(
+    "page_count, size, queue, priority",
+    [
+        (1, 10, "VALIDATION_SMALL_QUEUE", 0),
+        (25, 1000, "VALIDATION_SMALL_QUEUE", 0),
+        (26, 1000, "VALIDATION_LARGE_QUEUE", 9),
+        (25, 1001, "VALIDATION_LARGE_QUEUE", 9),
+        (400, 10, "VALIDATION_LARGE_QUEUE", 9),
+    ],
+)
+def test_documents_over_either_threshold_go_to_the_large_queue(
+    thresholds, page_count, size, queue, priority
+):
+    assert route_for_document(page_count, size) == {
+        "queue": getattr(settings, queue),
+        "priority": priority,
+    }
+
+
+def test_time_limits_grow_with_page_count(monkeypatch):
+    monkeypatch.setattr(settings, "TASK_SOFT_TIME_LIMIT_BASE", "30")
+    monkeypatch.setattr(settings, "TASK_SOFT_TIME_LIMIT_PER_PAGE", "0.5")
+    monkeypatch.setattr(settings, "TASK_HARD_TIME_LIMIT_GRACE", "20")
+
+    assert time_limits_for_document(100) == {"soft_time_limit": 80.0, "time_limit": 100.0}
+
+
+def worker_queues(tmp_path, **env):
+    """Run worker-start.sh against a celery that prints its arguments; return -Q."""
+    celery = tmp_path / "celery"
+    celery.write_text('#!/bin/sh\necho "$@"\n')
+    celery.chmod(0o755)
+    environ = {
+        name: value
+        for name, value in os.environ.items()
+        if name not in ("VALIDATION_SMALL_QUEUE", "VALIDATION_LARGE_QUEUE", "CELERY_QUEUES")
+    }
+    environ.update(env, PATH=f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    args = subprocess.run(
+        ["bash", str(WORKER_START)], env=environ, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return args[args.index("-Q") + 1]
+
+
+def test_worker_consumes_every_queue_by_default(tmp_path):
+    assert worker_queues(tmp_path) == "celery,validation_small,validation_large"
+
+
+def test_worker_queue_names_follow_the_settings(tmp_path):
+    queues = worker_queues(
+        tmp_path, VALIDATION_SMALL_QUEUE="forms", VALIDATION_LARGE_QUEUE="applications"
+    )
+
+    assert queues == "celery,forms,applications"
+
+
+def test_celery_queues_overrides_the_queue_list(tmp_path):
+    queues = worker_queues(
+        tmp_path, VALIDATION_SMALL_QUEUE="forms", CELERY_QUEUES="applications"
+    )
+
+    assert queues == "applications"
@@ -0,0 +1,59 @@
+import sys
+from app.core.config import settings
+
+if settings.VALIDATORS_DIR not in sys.path:
+    sys.path.append(settings.VALIDATORS_DIR)
+
+from section_index import Section, SectionIndex  # noqa: E402
+
+TOC = [
+    [1, "Research Strategy", 3],
+    [2, "Significance", 3],
+    [2, "Approach", 5],
+    [3, "Preliminary Data", 6],
+    [2, "Timeline", 9],
+    [1, "Bibliography", 11],
+    [1, "Unlinked Entry", -1],
+]
+
+
+def test_section_ends_before_next_entry_at_same_or_shallower_level():
+    index = SectionIndex.from_toc(TOC, page_count=14)
+
+    assert index.sections == [
+        Section(1, "Research Strategy", 3, 10),
+        Section(2, "Significance", 3, 4),
+        Section(2, "Approach", 5, 8),
+        Section(3, "Preliminary Data", 6, 8),
+        Section(2, "Timeline", 9, 10),
+        Section(1, "Bibliography", 11, 14),
+    ]
+
+
+def test_section_range_matches_title_case_insensitively():
+    index = SectionIndex.from_toc(TOC, page_count=14)
+
+    assert index.section_range("research strategy") == (3, 10)
+    assert index.section_range("APPROACH") == (5, 8)
+    assert index.section_range("Vertebrate Animals") == (None, None)
+
+
+def test_section_for_page_returns_deepest_section():
+    index = SectionIndex.from_toc(TOC, page_count=14)
+
+    assert index.section_for_page(1) is None
+    assert index.section_for_page(3).title == "Significance"
+    assert index.section_for_page(5).title == "Approach"
+    assert index.section_for_page(7).title == "Preliminary Data"
+    assert index.section_for_page(9).title == "Timeline"
+    assert index.section_for_page(14).title == "Bibliography"
+    assert index.section_for_page(15) is None
+
+
+def test_section_index_round_trips_through_dict():
+    index = SectionIndex.from_toc(TOC, page_count=14)
+
+    restored = SectionIndex.from_dict(index.to_dict())
+
+    assert restored.sections == index.sections
+    assert restored.section_for_page(7).title == "Preliminary Data"
@@ -0,0 +1,54 @@
+import sys
+from app.core.config import settings
+
+if settings.VALIDATORS_DIR not in sys.path:
+    sys.path.append(settings.VALIDATORS_DIR)
+
+from matcher import EXACT, HeaderMatcher  # noqa: E402
+from segmenter import Segment, segment_elements  # noqa: E402
+
+MATCHER = HeaderMatcher(
+    [
+        "Element 1",
+        "Element 1: Data Type",
+        "Element 2",
+        ("Element 3", EXACT),
+    ]
+)
+
+
+def test_longest_pattern_at_same_line_wins():
+    text = "Element 1: Data Type\nimages\nElement 2: Tools\nnone\n"
+
+    assert segment_elements(text, MATCHER) == [
+        Segment("Element 1: Data Type", 0, 28, 1),
+        Segment("Element 2", 28, len(text), 1),
+    ]
+
+
+def test_segments_carry_the_page_of_their_header():
+    text = "Element 1\nfirst page\nElement 2\nsecond page\n"
+    page_starts = [0, text.index("second page")]
+
+    segments = segment_elements(text, MATCHER, page_starts)
+
+    assert [(segment.element, segment.page) for segment in segments] == [
+        ("Element 1", 1),
+        ("Element 2", 1),
+    ]
+
+    page_starts = [0, text.index("Element 2")]
+    segments = segment_elements(text, MATCHER, page_starts)
+
+    assert [segment.page for segment in segments] == [1, 2]
+
+
+def test_segments_only_use_matches_of_the_requested_mode():
+    text = "Element 1\nbody\nElement 3\n"
+
+    assert [segment.element for segment in segment_elements(text, MATCHER)] == [
+        "Element 1"
+    ]
+    assert segment_elements(text, MATCHER, mode=EXACT) == [
+        Segment("Element 3", 15, len(text), 1)
+    ]
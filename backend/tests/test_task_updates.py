@@ -0,0 +1,36 @@
+import json
+import asyncio
+import pytest
+from app.core.config import settings
+from app.core.task_updates import TaskUpdatesHub, CHANNEL_PREFIX
+
+
+@pytest.mark.asyncio
+async def test_update_published_right_after_subscribe_is_delivered():
+    hub = TaskUpdatesHub(settings.CELERY_BROKER_URL)
+    try:
+        async with hub.subscribe("fast-task") as updates:
+            settings.redis_client.publish(
+                f"{CHANNEL_PREFIX}fast-task", json.dumps({"status": "SUCCESS"})
+            )
+            update = await asyncio.wait_for(updates.get(), timeout=5)
+        assert update == {"status": "SUCCESS"}
+    finally:
+        await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_updates_reach_only_watchers_of_their_task():
+    hub = TaskUpdatesHub(settings.CELERY_BROKER_URL)
+    try:
+        async with hub.subscribe("task-a") as updates_a, hub.subscribe("task-b") as updates_b:
+            settings.redis_client.publish(
+                f"{CHANNEL_PREFIX}task-b", json.dumps({"status": "PROGRESS"})
+            )
+            update = await asyncio.wait_for(updates_b.get(), timeout=5)
+            assert update == {"status": "PROGRESS"}
+            assert updates_a.empty()
+            assert hub.watcher_count == 2
+        assert hub.watcher_count == 0
+    finally:
+        await hub.close()
@@ -1,6 +1,18 @@
+import time
 import pytest
+from types import SimpleNamespace
 from httpx import AsyncClient
-from uuid import uuid4
+from passlib.hash import bcrypt
+from sqlalchemy import select
+from app.core import token_cache as token_cache_module
+from app.core.config import settings
+from app.core.password_hasher import password_context, password_hasher
+from app.core.token_cache import token_cache
+from app.core.user_cache import user_cache
+from app.db.database import SessionLocal
+from app.models.user import User
+from app.services import user as user_module
+from app.services.user import UserService
 
 
 @pytest.mark.asyncio
@@ -13,7 +25,7 @@ async def test_user_signup(async_client: AsyncClient):
         "password": "String@123",
     }
     response = await async_client.post("/api/v1/user/signup", json=data)
-    assert response.status_code == 200
+    assert response.status_code == 201
 
 
 @pytest.mark.asyncio
@@ -24,7 +36,47 @@ async def test_user_login(async_client: AsyncClient, test_user):
         "remember_me": True,
     }
     response = await async_client.post("/api/v1/user/login", json=data)
-    assert response.status_code == 200
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password_hash(
+    async_client: AsyncClient, test_user
+):
+    async with SessionLocal() as db:
+        user = await db.get(User, test_user["id"])
+        user.password = bcrypt.using(rounds=4).hash(test_user["password"])
+        await db.commit()
+
+    data = {
+        "email": test_user["email"],
+        "password": test_user["password"],
+        "remember_me": False,
+    }
+    response = await async_client.post("/api/v1/user/login", json=data)
+    assert response.status_code == 201
+
+    async with SessionLocal() as db:
+        stored = await db.scalar(select(User.password).where(User.id == test_user["id"]))
+    assert not password_context.needs_update(stored)
+    assert password_context.verify(test_user["password"], stored)
+
+
+@pytest.mark.asyncio
+async def test_login_rejected_when_password_hasher_is_full(
+    async_client: AsyncClient, test_user, monkeypatch
+):
+    monkeypatch.setattr(password_hasher, "max_queue", 0)
+    rejected = password_hasher.rejected
+
+    data = {
+        "email": test_user["email"],
+        "password": test_user["password"],
+        "remember_me": False,
+    }
+    response = await async_client.post("/api/v1/user/login", json=data)
+    assert response.status_code == 503
+    assert password_hasher.rejected == rejected + 1
 
 
 @pytest.mark.asyncio
@@ -58,36 +110,103 @@ async def test_authorize(async_client: AsyncClient, test_user):
         "password": test_user["password"],
     }
     response = await async_client.post("/api/v1/user/authorize", data=form_data)
-    assert response.status_code == 200
+    assert response.status_code == 201
     assert "access_token" in response.json()
 
 
 @pytest.mark.asyncio
 async def test_current_authenticated_user(authorized_client, test_user):
     response = await authorized_client.post("/api/v1/user/current_authenticated_user")
-    assert response.status_code == 200
+    assert response.status_code == 201
     assert response.json()["email"] == test_user["email"]
 
 
 @pytest.mark.asyncio
-async def test_forgot_password(async_client: AsyncClient, test_user):
+async def test_forgot_password(async_client: AsyncClient, test_user, monkeypatch):
+    sent = []
+
+    async def send_password_reset_email(email, reset_token):
+        sent.append(email)
+
+    monkeypatch.setattr(
+        UserService, "send_password_reset_email", send_password_reset_email
+    )
     data = {"email": test_user["email"]}
     response = await async_client.post("/api/v1/user/forgot_password", json=data)
-    assert response.status_code == 200
+    assert response.status_code == 201
+    assert sent == [test_user["email"]]
 
 
 @pytest.mark.asyncio
 async def test_refresh_token(async_client: AsyncClient, refresh_token):
     data = {"refresh_token": refresh_token}
     response = await async_client.post("/api/v1/user/refresh_token", json=data)
-    assert response.status_code == 200
+    assert response.status_code == 201
 
 
 @pytest.mark.asyncio
 async def test_reset_password(async_client: AsyncClient, reset_token):
     data = {"reset_token": reset_token, "password": "String@12345"}
     response = await async_client.put("/api/v1/user/reset_password", json=data)
-    assert response.status_code == 200
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_reset_password_invalidates_cached_user(
+    authorized_client, test_user, reset_token
+):
+    response = await authorized_client.post("/api/v1/user/current_authenticated_user")
+    assert response.status_code == 201
+    assert await user_cache.get(test_user["id"]) is not None
+
+    data = {"reset_token": reset_token, "password": "String@12345"}
+    response = await authorized_client.put("/api/v1/user/reset_password", json=data)
+    assert response.status_code == 201
+    assert await user_cache.get(test_user["id"]) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_user_has_no_password_hash(test_user):
+    await UserService.invalidate_cached_user(test_user["id"])
+    async with SessionLocal() as db:
+        loaded = await UserService.get_cached_user(test_user["id"], db=db)
+        cached = await UserService.get_cached_user(test_user["id"], db=db)
+
+    assert loaded.password
+    assert cached.email == test_user["email"]
+    assert cached.password is None
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_not_served_from_cache(
+    authorized_client, token, monkeypatch
+):
+    response = await authorized_client.post("/api/v1/user/current_authenticated_user")
+    assert response.status_code == 201
+    assert token_cache.get(token) is not None
+
+    later = SimpleNamespace(time=lambda: time.time() + 7 * 24 * 60 * 60)
+    monkeypatch.setattr(token_cache_module, "time", later)
+    monkeypatch.setattr(user_module, "time", later)
+
+    assert token_cache.get(token) is None
+    response = await authorized_client.post("/api/v1/user/current_authenticated_user")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_token_cache_emptied_when_signing_key_changes(
+    authorized_client, token, monkeypatch
+):
+    response = await authorized_client.post("/api/v1/user/current_authenticated_user")
+    assert response.status_code == 201
+    assert token_cache.get(token) is not None
+
+    monkeypatch.setattr(settings, "JWT_SECRET_KEY", "rotated-secret")
+
+    assert token_cache.get(token) is None
+    response = await authorized_client.post("/api/v1/user/current_authenticated_user")
+    assert response.status_code == 403
 
 
 @pytest.mark.asyncio
@@ -100,8 +219,8 @@ async def test_reset_password_errors(async_client: AsyncClient):
 @pytest.mark.parametrize(
     "user_id, expected_status",
     [
-        (uuid4(), 404),  # Non-existent user ID
-        ("invalid-uuid", 422),  # Invalid UUID format
+        (999999, 404),  # Non-existent user ID
+        ("invalid-id", 422),  # Invalid ID format
     ],
 )
 @pytest.mark.asyncio
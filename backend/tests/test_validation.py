@@ -0,0 +1,99 @@
+import pytest
+from httpx import AsyncClient
+from app.db.database import SessionLocal
+from app.services.validation import ValidationService
+
+REPORT = {
+    "document_hash": "a" * 64,
+    "page_count": 40,
+    "passed": False,
+    "checks": [
+        {
+            "name": "summary",
+            "findings": [
+                {
+                    "rule": "summary",
+                    "section": "PROJECT SUMMARY",
+                    "page": None,
+                    "severity": "error",
+                    "code": "summary.252a67d5",
+                    "message": "Exceeding line limit",
+                }
+            ],
+        },
+        {"name": "narrative", "findings": []},
+    ],
+}
+
+
+@pytest.mark.asyncio
+async def test_validation_run_by_task_id(authorized_client: AsyncClient, test_user):
+    async with SessionLocal() as db:
+        await ValidationService.save_run(
+            task_id="test-run", report=REPORT, user_id=test_user["id"], db=db
+        )
+
+    response = await authorized_client.get(
+        "/api/v1/validation/run_by_task_id", params={"task_id": "test-run"}
+    )
+    assert response.status_code == 200
+    assert response.json()["finding_count"] == 1
+    assert response.json()["findings"][0]["code"] == "summary.252a67d5"
+
+    response = await authorized_client.get(
+        "/api/v1/validation/findings_by_rule", params={"rule": "summary"}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_validation_run_not_found(authorized_client: AsyncClient):
+    response = await authorized_client.get(
+        "/api/v1/validation/run_by_task_id", params={"task_id": "missing"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_validation_runs_unauthorized(async_client: AsyncClient):
+    response = await async_client.get("/api/v1/validation/runs")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_validation_runs_are_scoped_to_their_user(
+    authorized_client: AsyncClient, test_user, other_user_headers
+):
+    async with SessionLocal() as db:
+        await ValidationService.save_run(
+            task_id="test-run", report=REPORT, user_id=test_user["id"], db=db
+        )
+
+    response = await authorized_client.get("/api/v1/validation/runs")
+    assert [run["task_id"] for run in response.json()] == ["test-run"]
+    response = await authorized_client.get(
+        "/api/v1/validation/runs_by_document",
+        params={"document_hash": REPORT["document_hash"]},
+    )
+    assert len(response.json()) == 1
+
+    response = await authorized_client.get(
+        "/api/v1/validation/run_by_task_id",
+        params={"task_id": "test-run"},
+        headers=other_user_headers,
+    )
+    assert response.status_code == 404
+    for path, params in [
+        ("/api/v1/validation/runs", {}),
+        (
+            "/api/v1/validation/runs_by_document",
+            {"document_hash": REPORT["document_hash"]},
+        ),
+        ("/api/v1/validation/findings_by_rule", {"rule": "summary"}),
+    ]:
+        response = await authorized_client.get(
+            path, params=params, headers=other_user_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == []
@@ -1,4 +1,18 @@
 #! /usr/bin/env bash
 set -e
 
-celery -A app.worker worker -l info -c 1
+# WORKER_MODE=production runs one child per core (CELERY_WORKER_CONCURRENCY)
+# with fair scheduling; the default keeps a single child for development.
+# CELERY_QUEUES picks the queues this pool consumes, so small and large
+# documents can be given dedicated workers. By default it consumes all of
+# them, named as in app/core/config.py.
+SMALL_QUEUE="${VALIDATION_SMALL_QUEUE:-validation_small}"
+LARGE_QUEUE="${VALIDATION_LARGE_QUEUE:-validation_large}"
+QUEUES="${CELERY_QUEUES:-celery,$SMALL_QUEUE,$LARGE_QUEUE}"
+export DB_POOL_PROFILE=worker
+
+if [ "$WORKER_MODE" = "production" ]; then
+    exec celery -A app.worker worker -l info -O fair -Q "$QUEUES"
+else
+    exec celery -A app.worker worker -l info -c 1 -Q "$QUEUES"
+fi